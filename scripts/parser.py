@@ -1,5 +1,9 @@
-from r2x_core import DataStore
-from r2x_reeds import ReEDSConfig, ReEDSParser, ReEDSUpgrader
+import hashlib
+import os
+from pathlib import Path
+
+from r2x_core import DataStore, System
+from r2x_reeds import ReEDSConfig, ReEDSParser, ReEDSUpgrader, __version__
 
 # setup_logging(level="DEBUG")
 run_path = "/Users/psanchez/Downloads/Pacific/"
@@ -7,7 +11,31 @@ run_path = "/Users/psanchez/Downloads/Pacific/"
 
 upgrader = ReEDSUpgrader(path=run_path)
 config = ReEDSConfig(weather_year=2012, solve_year=2032)
-store = DataStore.from_plugin_config(config, path=run_path)
 
-parser = ReEDSParser(config=config, store=store, system_name="ERCOT")
-sys = parser.build_system()
+# Set R2X_REEDS_CACHE=1 to reuse the serialized system between runs of this script. The cache key
+# covers the run folder, the latest modification time of any file in it (inputs_case/ and outputs/
+# included), the installed r2x_reeds version and the parser configuration.
+use_cache = os.environ.get("R2X_REEDS_CACHE") == "1"
+cache_file = None
+if use_cache:
+    run_mtime = max(
+        (entry.stat().st_mtime_ns for entry in Path(run_path).rglob("*") if entry.is_file()),
+        default=0,
+    )
+    cache_key = hashlib.blake2b(
+        f"{Path(run_path).resolve()}|{run_mtime}|{__version__}|{config.model_dump_json()}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    cache_file = Path.home() / ".cache" / "r2x_reeds" / f"{cache_key}.json"
+
+if cache_file is not None and cache_file.exists():
+    sys = System.from_json(cache_file)
+else:
+    store = DataStore.from_plugin_config(config, path=run_path)
+
+    parser = ReEDSParser(config=config, store=store, system_name="ERCOT")
+    sys = parser.build_system()
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        sys.to_json(cache_file, overwrite=True)
@@ -23,6 +23,8 @@ RESERVE_DIRECTION_MAP = {
     "DOWN": ReserveDirection.DOWN,
 }
 
+EMISSION_TYPE_MAP = {emission.value.casefold(): emission for emission in EmissionType}
+
 
 def map_reserve_type(value: str) -> Result[ReserveType, ValueError]:
     """Map string value to ReserveType enum.
@@ -90,7 +92,7 @@ def map_emission_type(value: str) -> Result[EmissionType, ValueError]:
     """Map string value to EmissionType enum.
 
     Handles case-insensitive matching of emission type strings to enum values
-    by iterating through available enum values.
+    through a lookup table keyed by the casefolded enum values.
 
     Parameters
     ----------
@@ -111,12 +113,10 @@ def map_emission_type(value: str) -> Result[EmissionType, ValueError]:
     >>> map_emission_type("unknown").is_err()
     True
     """
-    normalized = str(value).strip()
-    normalized_casefold = normalized.casefold()
-    for emission in EmissionType:
-        if emission.value.casefold() == normalized_casefold:
-            return Ok(emission)
-    return Err(ValueError(f"Unknown emission type: {value}"))
+    emission = EMISSION_TYPE_MAP.get(str(value).strip().casefold())
+    if emission is None:
+        return Err(ValueError(f"Unknown emission type: {value}"))
+    return Ok(emission)
 
 
 def map_emission_source(value: str | None) -> Result[EmissionSource, ValueError]:
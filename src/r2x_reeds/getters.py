@@ -40,8 +40,6 @@ def lookup_region(row: Any, *, context: PluginContext) -> Result[ReEDSRegion, Ex
     Result[ReEDSRegion, Exception]
         Ok(region) if found, Err(exception) if failed
     """
-    from r2x_reeds.models.components import ReEDSRegion
-
     try:
         region_name = get_row_field(row, "region")
         if region_name is None:
@@ -102,8 +100,6 @@ def compute_is_dispatchable(row: Any, *, context: PluginContext) -> Result[bool,
     Result[bool, Exception]
         Ok(True/False) based on technology category
     """
-    from r2x_reeds.parser_utils import tech_matches_category
-
     try:
         tech = get_row_field(row, "technology")
         if tech is None:
@@ -290,8 +286,6 @@ def _lookup_region_by_field(
     row: Any, field: str, *, context: PluginContext
 ) -> Result[ReEDSRegion, Exception]:
     """Shared helper to look up regions by a configurable field."""
-    from r2x_reeds.models.components import ReEDSRegion
-
     try:
         region_name = get_row_field(row, field)
         if region_name is None:
@@ -309,8 +303,6 @@ def _lookup_reserve_region_by_field(
     row: Any, field: str, *, context: PluginContext
 ) -> Result[ReEDSReserveRegion, Exception]:
     """Fetch reserve regions by alternative field names."""
-    from r2x_reeds.models.components import ReEDSReserveRegion
-
     try:
         region_name = get_row_field(row, field)
         if region_name is None:
@@ -372,8 +364,6 @@ def lookup_transmission_interface(row: Any, *, context: PluginContext) -> Result
     if context.system is None:
         return Err(ValueError("System not available in context"))
 
-    from r2x_reeds.models.components import ReEDSInterface
-
     name_result = build_transmission_interface_name(row, context=context)
     if name_result.is_err():
         return Err(name_result.err())
@@ -8,6 +8,7 @@ using the new Plugin[ReEDSConfig] pattern with lifecycle hooks.
 from __future__ import annotations
 
 import calendar
+from collections import defaultdict
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 from functools import partial
@@ -1182,6 +1183,36 @@ class ReEDSParser(Plugin[ReEDSConfig]):
         attached_count = 0
         reserves = list(system.get_components(ReEDSReserve))
         logger.trace("Attaching reserve requirements for {} reserve components", len(reserves))
+
+        # Group wind, solar and load inputs by transmission region in a single pass over each
+        # component type instead of rescanning the whole system for every reserve.
+        reserve_regions = {reserve.name.rsplit("_", 1)[0] for reserve in reserves}
+        wind_by_region: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        solar_by_region: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        loads_by_region: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for gen in system.get_components(ReEDSGenerator):
+            if not gen.region or gen.region.transmission_region not in reserve_regions:
+                continue
+            is_wind = tech_matches_category(gen.technology, "wind", self._tech_categories)
+            is_solar = tech_matches_category(gen.technology, "solar", self._tech_categories)
+            if not (is_wind or is_solar):
+                continue
+            entry = {
+                "capacity": gen.capacity,
+                "time_series": system.get_time_series(gen).data if system.has_time_series(gen) else None,
+            }
+            if is_wind:
+                wind_by_region[gen.region.transmission_region].append(entry)
+            if is_solar:
+                solar_by_region[gen.region.transmission_region].append(entry)
+
+        for load in system.get_components(ReEDSDemand):
+            if not load.region or load.region.transmission_region not in reserve_regions:
+                continue
+            loads_by_region[load.region.transmission_region].append(
+                {"time_series": system.get_time_series(load).data if system.has_time_series(load) else None}
+            )
+
         for reserve in reserves:
             logger.debug("Calculating reserve requirement for {}", reserve.name)
             reserve_type_name = reserve.reserve_type.value.upper()
@@ -1194,37 +1225,9 @@ class ReEDSParser(Plugin[ReEDSConfig]):
             solar_pct = self._defaults.get("solar_reserves", {}).get(reserve_type_name, 0.0)
             load_pct = self._defaults.get("load_reserves", {}).get(reserve_type_name, 0.0)
 
-            wind_generators = [
-                {
-                    "capacity": gen.capacity,
-                    "time_series": system.get_time_series(gen).data if system.has_time_series(gen) else None,
-                }
-                for gen in system.get_components(ReEDSGenerator)
-                if gen.region
-                and gen.region.transmission_region == region_name
-                and tech_matches_category(gen.technology, "wind", self._tech_categories)
-            ]
-
-            solar_generators = [
-                {
-                    "capacity": gen.capacity,
-                    "time_series": system.get_time_series(gen).data if system.has_time_series(gen) else None,
-                }
-                for gen in system.get_components(ReEDSGenerator)
-                if gen.region
-                and gen.region.transmission_region == region_name
-                and tech_matches_category(gen.technology, "solar", self._tech_categories)
-            ]
-
-            loads = [
-                {
-                    "time_series": system.get_time_series(load).data
-                    if system.has_time_series(load)
-                    else None,
-                }
-                for load in system.get_components(ReEDSDemand)
-                if load.region and load.region.transmission_region == region_name
-            ]
+            wind_generators = wind_by_region.get(region_name, [])
+            solar_generators = solar_by_region.get(region_name, [])
+            loads = loads_by_region.get(region_name, [])
             logger.trace(
                 "Reserve {} inputs - wind: {}, solar: {}, loads: {}",
                 reserve.name,
@@ -81,16 +81,15 @@ def tech_matches_category(tech: str, category_name: str, tech_categories: dict[s
     tech_value = str(tech).casefold()
 
     if isinstance(category, list):
-        normalized = [str(item).casefold() for item in category]
-        return tech_value in normalized
-
-    prefixes = [str(prefix).casefold() for prefix in category.get("prefixes", [])]
-    exact = [str(item).casefold() for item in category.get("exact", [])]
+        return tech_value in {str(item).casefold() for item in category}
 
+    exact = {str(item).casefold() for item in category.get("exact", [])}
     if tech_value in exact:
         return True
 
-    return any(tech_value.startswith(prefix) for prefix in prefixes)
+    # str.startswith accepts a tuple, which checks every prefix in a single C-level call.
+    prefixes = tuple(str(prefix).casefold() for prefix in category.get("prefixes", []))
+    return tech_value.startswith(prefixes)
 
 
 def get_technology_category(
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from importlib.resources import files
 from os import PathLike
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from infrasys.supplemental_attribute import SupplementalAttribute
 from loguru import logger
 from pydantic import Field
@@ -16,11 +17,13 @@ from rust_ok import Err, Ok, Result
 from r2x_core import DataStore, PluginConfig, expose_plugin
 from r2x_reeds.models import ReEDSGenerator
 
-from .utils import _coerce_path, _deduplicate_records
+from .utils import _coerce_path, _deduplicate_records, _gc_paused, _read_json_cached
 
 if TYPE_CHECKING:
     from r2x_core import System
 
+DEFAULT_REFERENCE_UNITS_FPATH = Path(str(files("r2x_reeds").joinpath("config/pcm_defaults.json")))
+
 
 class BreakGensConfig(PluginConfig):
     """Configuration for breaking oversized generators into reference-sized units."""
@@ -73,28 +76,27 @@ def _break_system_generators(
     break_category: str = "category",
 ) -> System:
     """Break component generator into smaller units."""
-    skip_set: set[str] = {str(value) for value in skip_categories} if skip_categories else set()
+    skip_set: frozenset[str] = (
+        frozenset(str(value) for value in skip_categories) if skip_categories else frozenset()
+    )
 
-    capacity_dropped = 0
-    for component in system.get_components(
-        ReEDSGenerator, filter_func=lambda comp: getattr(comp, break_category, None)
-    ):
+    # Build the component predicate once so the category lookup and the skip-list check run in
+    # a single pass inside get_components instead of being repeated in the loop body.
+    def _is_breakable(comp: ReEDSGenerator, _skip: frozenset[str] = skip_set) -> bool:
+        """Return True if the component has a category value that is not skipped."""
+        tech_value = getattr(comp, break_category, None)
+        return bool(tech_value) and str(tech_value) not in _skip
+
+    # Collect candidates first so the capacity arithmetic can run as a single vectorized pass and
+    # components are not removed from the system while it is being iterated.
+    candidates: list[ReEDSGenerator] = []
+    reference_capacities: list[float] = []
+    for component in system.get_components(ReEDSGenerator, filter_func=_is_breakable):
         tech_key = str(getattr(component, break_category))
-        logger.trace("Extracted technology key: {}", tech_key)
-
-        if skip_set and tech_key in skip_set:
-            logger.trace(
-                "Skipping component {} because {}={} is in skip list",
-                component.name,
-                break_category,
-                tech_key,
-            )
-            continue
-
-        logger.trace(f"Breaking {component.name}")
+        logger.trace("Breaking {} with {}={}", component.name, break_category, tech_key)
 
         if not (reference_tech := reference_units.get(tech_key)):
-            logger.trace(f"{tech_key} not found in reference_units")
+            logger.trace("{} not found in reference_units", tech_key)
             continue
 
         if not (capacity := reference_tech.get("capacity_MW", None)):
@@ -102,62 +104,65 @@ def _break_system_generators(
             logger.info("`capacity_MW` not found on reference_tech")
             continue
 
-        # Use `.capacity` field directly (float in MW)
-        reference_base_power = component.capacity
-        no_splits = int(reference_base_power // capacity)
-        remainder = reference_base_power % capacity
-
-        if no_splits <= 1:
-            logger.trace("Number of splits <= 1. Skipping.")
-            continue
+        candidates.append(component)
+        reference_capacities.append(capacity)
 
-        split_no = 1
-        logger.trace(
-            f"Breaking generator {component.name} with capacity {reference_base_power} "
-            f"into {no_splits} generators of {capacity} capacity"
-        )
-
-        for _ in range(no_splits):
-            component_name = component.name + f"_{split_no:02}"
-            _create_split_generator(system, component, component_name, capacity)
-            split_no += 1
-
-        if remainder > capacity_threshold:
-            component_name = component.name + f"_{split_no:02}"
-            _create_split_generator(system, component, component_name, remainder)
-        else:
-            capacity_dropped += remainder
-            logger.debug(f"Dropped {remainder} capacity for {component.name}")
-
-        system.remove_component(component)
-    else:
+    if not candidates:
         logger.info("No generator found that match the category. Skipping plugin.")
+        return system
+
+    # Use `.capacity` field directly (float in MW)
+    base_powers = np.fromiter((component.capacity for component in candidates), dtype=np.float64)
+    unit_capacities = np.asarray(reference_capacities, dtype=np.float64)
+    split_counts, remainders = np.divmod(base_powers, unit_capacities)
+
+    capacity_dropped = 0.0
+    # Splitting allocates many short-lived pydantic models; pause cyclic GC until they are stored.
+    with _gc_paused():
+        for component, capacity, no_splits, remainder in zip(
+            candidates,
+            unit_capacities.tolist(),
+            split_counts.astype(np.int64).tolist(),
+            remainders.tolist(),
+            strict=True,
+        ):
+            if no_splits <= 1:
+                logger.trace("Number of splits <= 1. Skipping.")
+                continue
+
+            split_no = 1
+            logger.trace(
+                "Breaking generator {} with capacity {} into {} generators of {} capacity",
+                component.name,
+                component.capacity,
+                no_splits,
+                capacity,
+            )
+
+            new_components: list[ReEDSGenerator] = []
+            for _ in range(no_splits):
+                component_name = component.name + f"_{split_no:02}"
+                new_components.append(_build_split_generator(component, component_name, capacity))
+                split_no += 1
+
+            if remainder > capacity_threshold:
+                component_name = component.name + f"_{split_no:02}"
+                new_components.append(_build_split_generator(component, component_name, remainder))
+            else:
+                capacity_dropped += remainder
+                logger.debug("Dropped {} capacity for {}", remainder, component.name)
 
-    logger.debug(f"Total capacity dropped {capacity_dropped} MW")
+            system.add_components(*new_components)
+            _copy_component_data(system, component, *new_components)
+
+            system.remove_component(component)
+
+    logger.debug("Total capacity dropped {} MW", capacity_dropped)
     return system
 
 
-def _create_split_generator(
-    system: System, original: ReEDSGenerator, name: str, new_capacity: float
-) -> ReEDSGenerator:
-    """Create a new split generator component.
-
-    Parameters
-    ----------
-    system : System
-        System to add the new generator to.
-    original : ReEDSGenerator
-        Original generator component to split.
-    name : str
-        Name for the new split generator.
-    new_capacity : float
-        Capacity of the new generator (MW).
-
-    Returns
-    -------
-    ReEDSGenerator
-        The newly created split generator component.
-    """
+def _build_split_generator(original: ReEDSGenerator, name: str, new_capacity: float) -> ReEDSGenerator:
+    """Build a split generator from the original without adding it to a system."""
     logger.trace("Creating split generator {} with capacity {}", name, new_capacity)
     component = type(original)(
         name=name,
@@ -174,19 +179,24 @@ def _create_split_generator(
         vintage=original.vintage,
     )
     logger.trace("Created new generator {} with capacity {}", component.label, new_capacity)
-    system.add_component(component)
+    return component
+
 
+def _copy_component_data(system: System, original: ReEDSGenerator, *components: ReEDSGenerator) -> None:
+    """Copy supplemental attributes and time series from the original to split generators.
+
+    The original is queried once and the results are attached to every split component.
+    """
     attributes: list[SupplementalAttribute] = system.get_supplemental_attributes_with_component(original)
     for attribute in attributes:
         logger.trace("Component {} has supplemental attribute {}. Copying.", original.label, attribute.label)
-        system.add_supplemental_attribute(component, attribute)
+        for component in components:
+            system.add_supplemental_attribute(component, attribute)
 
     if system.has_time_series(original):
         logger.trace("Component {} has time series attached. Copying.", original.label)
         ts = system.get_time_series(original)
-        system.add_time_series(ts, component)
-
-    return component
+        system.add_time_series(ts, *components)
 
 
 def _load_reference_units(
@@ -195,13 +205,11 @@ def _load_reference_units(
     """Load reference generator definitions and deduplicate them."""
     if reference_units is None:
         logger.info("No reference_units provided. Using package defaults from pcm_defaults.json")
-        fpath = Path(str(files("r2x_reeds").joinpath("config/pcm_defaults.json")))
-
         try:
-            reference_units = json.loads(fpath.read_text())
+            reference_units = _read_json_cached(DEFAULT_REFERENCE_UNITS_FPATH)
         except Exception as exc:
             return Err(exc)
-        return _normalize_reference_data(reference_units, dedup_key, fpath)
+        return _normalize_reference_data(reference_units, dedup_key, DEFAULT_REFERENCE_UNITS_FPATH)
 
     if isinstance(reference_units, dict):
         return _normalize_reference_data(reference_units, dedup_key, "<in-memory reference technologies>")
@@ -233,20 +241,40 @@ def _load_reference_units(
 def _normalize_reference_data(
     reference_data: Any, dedup_key: str, source: Path | str | PathLike
 ) -> Result[dict[str, dict[str, Any]], Exception]:
-    """Convert raw reference data into a keyed dict with helpful errors."""
+    """Convert raw reference data into a keyed dict with helpful errors.
+
+    Keys are interned because they are looked up once per generator when breaking units.
+    """
+    reference_units: dict[str, dict[str, Any]] = {}
     if isinstance(reference_data, dict):
-        normalized_input: list[dict[str, Any]] = []
+        # Mapping input is already keyed, so build the result directly instead of flattening it
+        # into a list and running it back through the generic deduplication pass.
+        duplicates: set[str] = set()
         for key, record in reference_data.items():
             if not isinstance(record, dict):
                 logger.warning("Skipping non-dict reference record for key '{}': {}", key, record)
                 continue
+            key_value = record.get(dedup_key, key)
+            if key_value is None:
+                logger.warning("Skipping reference record missing key '{}' in {}", dedup_key, source)
+                continue
+            key_value = sys.intern(str(key_value))
+            if key_value in reference_units:
+                duplicates.add(key_value)
+                continue
             normalized_record = dict(record)
             normalized_record.setdefault(dedup_key, key)
-            normalized_input.append(normalized_record)
-        reference_data = normalized_input
+            reference_units[key_value] = normalized_record
+
+        if duplicates:
+            logger.warning(
+                "Duplicate entries found for key '{}' while loading reference technologies: {}. "
+                "Keeping first occurrence.",
+                dedup_key,
+                ", ".join(sorted(duplicates)),
+            )
 
-    if isinstance(reference_data, list):
-        reference_units: dict[str, dict[str, Any]] = {}
+    elif isinstance(reference_data, list):
         for record in _deduplicate_records(reference_data, key=dedup_key):
             if not isinstance(record, dict):
                 logger.warning("Skipping non-dict reference record: {}", record)
@@ -259,16 +287,17 @@ def _normalize_reference_data(
                     source,
                 )
                 continue
-            reference_units[str(key_value)] = record
+            reference_units[sys.intern(str(key_value))] = record
 
-        if reference_units:
-            return Ok(reference_units)
+    else:
+        msg = f"reference_technologies must be a dict or JSON array of dicts, got {type(reference_data).__name__}"
+        return Err(TypeError(msg))
 
-        msg = (
-            f"No reference technologies with key '{dedup_key}' were found in {source}. "
-            "Ensure the file contains at least one valid entry."
-        )
-        return Err(ValueError(msg))
+    if reference_units:
+        return Ok(reference_units)
 
-    msg = f"reference_technologies must be a dict or JSON array of dicts, got {type(reference_data).__name__}"
-    return Err(TypeError(msg))
+    msg = (
+        f"No reference technologies with key '{dedup_key}' were found in {source}. "
+        "Ensure the file contains at least one valid entry."
+    )
+    return Err(ValueError(msg))
@@ -136,53 +136,62 @@ def _apply_ccs_credit(
     # Some technologies on ReEDS are eligible for incentive but have not been upgraded yet.
     # Since the co2_incentive does not capture all the possible technologies, we get the
     # technologies before upgrading and if they exist in the system we apply the incentive.
-    incentive = co2_incentive.join(upgrade_link, left_on="tech", right_on="to", how="left")
+    # Only rows reachable from technologies present in the system can match a generator, so
+    # both tables are narrowed to those technologies first.
+    system_techs = list({generator.technology for generator in system.get_components(ReEDSGenerator)})
+    upgrade_link = upgrade_link.filter(pl.col("from").is_in(system_techs))
+    upgrade_targets: dict[str, set[str]] = {}
+    for from_tech, to_tech in upgrade_link.select("from", "to").iter_rows():
+        if to_tech is not None:
+            upgrade_targets.setdefault(from_tech, set()).add(to_tech)
+    co2_incentive = co2_incentive.filter(
+        pl.col("tech").is_in(system_techs + upgrade_link["to"].drop_nulls().to_list())
+    )
+
+    # Get set of CCS technologies: incentivized techs plus the techs that upgrade into them.
+    incentive_techs = set(co2_incentive["tech"].drop_nulls().to_list())
+    ccs_techs = incentive_techs | {
+        tech for tech, targets in upgrade_targets.items() if targets & incentive_techs
+    }
 
-    # Get list of CCS technologies
-    ccs_techs = incentive["tech"].unique().to_list()
-    from_column = incentive["from"]
-    if from_column is not None:
-        ccs_techs.extend(from_column.drop_nulls().unique().to_list())
-    ccs_techs = list(set(ccs_techs))  # Remove duplicates
+    # Index the rows of each table by (tech, region, vintage) once so every generator resolves its
+    # production rate and incentive with dictionary lookups instead of filtering the frames.
+    production_rows = _index_rows(production_rate, ("tech", "region", "vintage"))
+    incentive_rows = _index_rows(co2_incentive, ("tech", "region", "vintage"))
 
     for generator in system.get_components(
         ReEDSGenerator, filter_func=lambda gen: gen.technology in ccs_techs
     ):
-        reeds_tech = generator.technology
-        reeds_vintage = generator.vintage
-        reeds_region = generator.region.name
-
-        # Create filter for this generator's characteristics
-        reeds_tech_mask = (
-            (pl.col("tech") == reeds_tech)
-            & (pl.col("region") == reeds_region)
-            & (pl.col("vintage") == reeds_vintage)
-        )
+        key = (generator.technology, generator.region.name, generator.vintage)
 
-        generator_production_rate = production_rate.filter(reeds_tech_mask)
-
-        if generator_production_rate.is_empty():
+        generator_production_rows = production_rows.get(key)
+        if not generator_production_rows:
             msg = f"Generator {generator.name} does not appear in the production rate file. Skipping it."
             logger.debug(msg)
             continue
 
-        # Filter for upgrade path if it exists
-        upgrade_mask = (
-            (pl.col("from") == reeds_tech)
-            & (pl.col("region") == reeds_region)
-            & (pl.col("vintage") == reeds_vintage)
-        )
-
         try:
-            # Get incentive value - try direct match first, then upgrade path
-            incentive_matches = incentive.filter(reeds_tech_mask.or_(upgrade_mask))
+            # Get incentive value - direct match or upgrade path
+            candidate_keys = [key] + [
+                (target, key[1], key[2]) for target in upgrade_targets.get(generator.technology, ())
+            ]
+            incentive_matches = sorted(
+                {row for candidate in candidate_keys for row in incentive_rows.get(candidate, ())}
+            )
 
-            if incentive_matches.is_empty():
+            if not incentive_matches:
                 logger.debug(f"No incentive found for {generator.name}")
                 continue
 
-            generator_incentive = incentive_matches["incentive"].item()
-            capture_rate = generator_production_rate["capture_rate"].item()
+            if len(incentive_matches) != 1 or len(generator_production_rows) != 1:
+                msg = (
+                    f"expected a single incentive and capture rate entry, found "
+                    f"{len(incentive_matches)} and {len(generator_production_rows)}"
+                )
+                raise ValueError(msg)
+
+            generator_incentive = co2_incentive["incentive"][incentive_matches[0]]
+            capture_rate = production_rate["capture_rate"][generator_production_rows[0]]
             uos_charge = -generator_incentive * capture_rate
 
             generator.ext["UoS Charge"] = uos_charge
@@ -197,3 +206,13 @@ def _apply_ccs_credit(
             continue
 
     return system
+
+
+def _index_rows(frame: pl.DataFrame, key_columns: tuple[str, ...]) -> dict[tuple[str, ...], list[int]]:
+    """Map each key tuple to the row positions where it appears, skipping rows with null keys."""
+    index: dict[tuple[str, ...], list[int]] = {}
+    for position, key in enumerate(frame.select(key_columns).iter_rows()):
+        if None in key:
+            continue
+        index.setdefault(key, []).append(position)
+    return index
@@ -133,24 +133,37 @@ def _add_electrolyzer_load(
         index="hour", on="region", values="load_MW", aggregate_function="sum"
     )
 
-    # Join with hour map to get full 8760 hours
-    total_load_per_region = hour_map.join(load_data_pivot, on="hour", how="left").fill_null(0)
+    # Join with hour map to get full 8760 hours. The join runs as a single lazy plan that only
+    # keeps the region columns, so the hour map's other columns are never materialized. Loads are
+    # cast to float64 in the same plan, matching the dtype the parser uses for time series.
+    region_columns = [column for column in load_data_pivot.columns if column != "hour"]
+    total_load_per_region = (
+        hour_map.lazy()
+        .join(load_data_pivot.lazy(), on="hour", how="left", maintain_order="left")
+        .select(pl.col(region_columns).cast(pl.Float64))
+        .fill_null(0.0)
+        .collect()
+    )
+
+    # Materialize every region column as one (hours, regions) matrix instead of selecting and
+    # converting each region column separately. Column-major order keeps each region's profile
+    # contiguous, so copying a column out of it below is a single block copy.
+    load_matrix = total_load_per_region.to_numpy(order="fortran")
+    max_loads = load_matrix.max(axis=0) if load_matrix.shape[0] else np.zeros(len(region_columns))
 
-    for region_name in electrolyzer_load.select("region").unique().to_series():
+    regions_by_name = {region.name: region for region in system.get_components(ReEDSRegion)}
+    pending: list[tuple[ReEDSDemand, SingleTimeSeries]] = []
+    for column_index, region_name in enumerate(region_columns):
         # Get the ReEDS region component
-        try:
-            region = system.get_component(ReEDSRegion, name=region_name)
-        except Exception:
+        region = regions_by_name.get(region_name)
+        if region is None:
             logger.warning(f"Region {region_name} not found in system. Skipping electrolyzer load.")
             continue
 
         # Calculate total electrolyzer load for the region
-        if region_name not in total_load_per_region.columns:
-            logger.debug(f"No electrolyzer load data for region {region_name}")
-            continue
-
-        region_load_data = total_load_per_region[region_name].to_numpy()
-        max_load = float(np.max(region_load_data))
+        # Copy the column so each time series owns its data instead of aliasing the shared matrix.
+        region_load_data = load_matrix[:, column_index].copy()
+        max_load = float(max_loads[column_index])
 
         # Assert that max load is greater than 1 MW
         if max_load < 1:
@@ -172,8 +185,6 @@ def _add_electrolyzer_load(
             "original_region": region_name,
         }
 
-        system.add_component(electrolyzer_demand)
-
         # Create time series for hourly load
         ts = SingleTimeSeries.from_array(
             data=region_load_data,  # Data in MW
@@ -181,14 +192,26 @@ def _add_electrolyzer_load(
             initial_timestamp=datetime(year=weather_year, month=1, day=1),
             resolution=timedelta(hours=1),
         )
-
-        # Add time series to the component
-        system.add_time_series(ts, electrolyzer_demand)
+        pending.append((electrolyzer_demand, ts))
         logger.debug("Adding electrolyzer load to region: {}", region_name)
 
+    if not pending:
+        return system
+
+    # Register all demands at once and write their time series within one store session.
+    system.add_components(*(demand for demand, _ in pending))
+    with system.open_time_series_store() as context:
+        for electrolyzer_demand, ts in pending:
+            system.add_time_series(ts, electrolyzer_demand, context=context)
+
     return system
 
 
+def _is_hydrogen_generator(generator: ReEDSGenerator) -> bool:
+    """Return True if the generator name or technology identifies it as hydrogen-fueled."""
+    return "h2" in generator.name.lower() or "hydrogen" in generator.technology.lower()
+
+
 def _add_hydrogen_fuel_price(system: System, h2_prices: pl.DataFrame, weather_year: int) -> System:
     """Add monthly hydrogen fuel price for generators using hydrogen.
 
@@ -222,22 +245,26 @@ def _add_hydrogen_fuel_price(system: System, h2_prices: pl.DataFrame, weather_ye
         dtype="datetime64[h]",
     )[:-24]  # Removing 1 day to match ReEDS convention
 
-    months = np.array([dt.astype("datetime64[M]").astype(int) % 12 + 1 for dt in date_time_array])
+    months = (date_time_array.astype("datetime64[M]").astype(np.int64) % 12 + 1).astype(np.int8)
+    month_indices = {month: np.flatnonzero(months == month) for month in range(1, 13)}
+    initial_timestamp = datetime(year=weather_year, month=1, day=1)
+
+    # Split the prices by region once instead of scanning the frame for every generator.
+    h2_prices_by_region = {
+        region_key[0]: region_frame
+        for region_key, region_frame in h2_prices.partition_by("region", as_dict=True).items()
+    }
 
     # Adding fuel price for all hydrogen generators
-    for h2_generator in system.get_components(
-        ReEDSGenerator, filter_func=lambda x: "h2" in x.name.lower() or "hydrogen" in x.technology.lower()
-    ):
+    for h2_generator in system.get_components(ReEDSGenerator, filter_func=_is_hydrogen_generator):
         region_name = h2_generator.region.name
 
-        if region_name not in h2_prices.select("region").unique().to_series().to_list():
+        region_h2_fprice = h2_prices_by_region.get(region_name)
+        if region_h2_fprice is None:
             logger.debug(f"No hydrogen fuel price data for region {region_name}")
             continue
 
-        region_h2_fprice = h2_prices.filter(pl.col("region") == region_name)
-
-        month_datetime_series = np.zeros(len(date_time_array), dtype=float)
-
+        month_datetime_series = np.zeros(len(date_time_array), dtype=np.float64)
         for row in region_h2_fprice.iter_rows(named=True):
             # Handle month as either string or int
             month_val = row["month"]
@@ -246,19 +273,20 @@ def _add_hydrogen_fuel_price(system: System, h2_prices: pl.DataFrame, weather_ye
             else:
                 month = int(month_val)
 
-            month_filter = np.where(months == month)
+            if (month_filter := month_indices.get(month)) is None:
+                continue
             month_datetime_series[month_filter] = row["h2_price"]
 
         # Units from monthly hydrogen fuel price are in $/kg
         # Convert $/kg to $/MWh using conversion factor
         # Typical conversion: ~33.3 kWh/kg H2, so 1 kg = 0.0333 MWh
         # Therefore $/kg * (1 kg / 0.0333 MWh) = $/MWh * 30
-        month_datetime_series = month_datetime_series * 30.0  # Convert $/kg to $/MWh
+        month_datetime_series *= 30.0  # Convert $/kg to $/MWh
 
         ts = SingleTimeSeries.from_array(
             data=month_datetime_series,  # Data in $/MWh
             name="fuel_price",
-            initial_timestamp=datetime(year=weather_year, month=1, day=1),
+            initial_timestamp=initial_timestamp,
             resolution=timedelta(hours=1),
         )
 
@@ -96,17 +96,17 @@ def add_emission_cap(
         except Exception as e:
             logger.warning(f"Failed to extract emission cap value: {e}")
 
-    # Check for precombustion emissions if data files provided
+    # Check for precombustion emissions if data files provided. Emission rates are only read
+    # when the switches enable precombustion.
     if config.switches_fpath is not None and config.emission_rates_fpath is not None:
         try:
             switches = DataStore.load_file(config.switches_fpath, name="switches")
-            emit_rates = DataStore.load_file(config.emission_rates_fpath, name="emission_rates")
             if switches is not None:
                 switches = switches.collect()
-            if emit_rates is not None:
-                emit_rates = emit_rates.collect()
-            if switches is not None and emit_rates is not None:
-                _add_precombustion_if_enabled(system, switches, emit_rates)
+            if switches is not None and _precombustion_enabled(switches):
+                emit_rates = DataStore.load_file(config.emission_rates_fpath, name="emission_rates")
+                if emit_rates is not None:
+                    _add_precombustion_rates(system, emit_rates.collect())
         except Exception as e:
             logger.debug(f"Could not process precombustion emissions: {e}")
 
@@ -114,64 +114,55 @@ def add_emission_cap(
     return Ok(system)
 
 
-def _add_precombustion_if_enabled(system: System, switches: pl.DataFrame, emit_rates: pl.DataFrame) -> None:
-    """Add precombustion emissions if enabled in switches.
+def _precombustion_enabled(switches: pl.DataFrame | dict[str, Any]) -> bool:
+    """Return True if the switches turn on precombustion emissions.
 
-    Parameters
-    ----------
-    system : System
-        The system to modify.
-    switches : pl.DataFrame
-        Switches/configuration data.
-    emit_rates : pl.DataFrame
-        Emission rates data.
+    Only the `gsw_precombustion` and `gsw_annualcapco2e` rows are inspected.
     """
-    try:
-        # Convert switches to dictionary format if it's a DataFrame
-        if isinstance(switches, pl.DataFrame):
-            if switches.is_empty():
-                logger.warning("Switches data is empty")
-                return
-
-            # Try to extract the switch value
-            switches_dict = {}
-            if "switch_name" in switches.columns and "value" in switches.columns:
-                for row in switches.iter_rows(named=True):
-                    switches_dict[row["switch_name"]] = str(row["value"]).lower() in ["true", "1", "yes"]
-            else:
-                # Assume first column is name, second is value
-                cols = switches.columns
-                if len(cols) >= 2:
-                    for row in switches.iter_rows(named=True):
-                        key = row[cols[0]]
-                        val = str(row[cols[1]]).lower() in ["true", "1", "yes"]
-                        switches_dict[key] = val
-        else:
-            switches_dict = switches
-
-        # Check for precombustion flag
-        if switches_dict.get("gsw_precombustion") or switches_dict.get("gsw_annualcapco2e"):
-            # Process emission rates for precombustion
-            if emit_rates.is_empty():
-                return
-            emit_rates_processed = emit_rates.with_columns(
-                pl.concat_str(
-                    [pl.col("tech"), pl.col("tech_vintage"), pl.col("region")], separator="_"
-                ).alias("generator_name")
-            )
-
-            # Filter for precombustion emissions
-            any_precombustion = emit_rates_processed["emission_source"].str.contains("precombustion")
-            emit_rates_precomb = emit_rates_processed.filter(any_precombustion)
-
-            if not emit_rates_precomb.is_empty():
-                logger.debug("Adding precombustion emission.")
-                generator_with_precombustion = emit_rates_precomb.select(
-                    "generator_name", "emission_type", "rate"
-                ).unique()
-                add_precombustion(system, generator_with_precombustion)
-    except Exception as e:
-        logger.debug(f"Could not process precombustion emissions: {e}")
+    # Switches given as a mapping are read directly
+    if not isinstance(switches, pl.DataFrame):
+        return bool(switches.get("gsw_precombustion") or switches.get("gsw_annualcapco2e"))
+
+    if switches.is_empty():
+        logger.warning("Switches data is empty")
+        return False
+
+    if "switch_name" in switches.columns and "value" in switches.columns:
+        name_column, value_column = "switch_name", "value"
+    elif len(switches.columns) >= 2:
+        # Assume first column is name, second is value
+        name_column, value_column = switches.columns[:2]
+    else:
+        return False
+
+    switch_values = switches.filter(pl.col(name_column).is_in(["gsw_precombustion", "gsw_annualcapco2e"]))
+    return any(str(value).lower() in ["true", "1", "yes"] for value in switch_values[value_column])
+
+
+def _add_precombustion_rates(system: System, emit_rates: pl.DataFrame) -> None:
+    """Add the precombustion rows of the emission rates to the generator emissions."""
+    if emit_rates.is_empty():
+        return
+
+    # Keep only precombustion rows before building generator names, and let the
+    # projection and deduplication run in the same lazy plan.
+    generator_with_precombustion = (
+        emit_rates.lazy()
+        .filter(pl.col("emission_source").str.contains("precombustion"))
+        .select(
+            pl.concat_str([pl.col("tech"), pl.col("tech_vintage"), pl.col("region")], separator="_").alias(
+                "generator_name"
+            ),
+            "emission_type",
+            "rate",
+        )
+        .unique()
+        .collect()
+    )
+
+    if not generator_with_precombustion.is_empty():
+        logger.debug("Adding precombustion emission.")
+        add_precombustion(system, generator_with_precombustion)
 
 
 def add_precombustion(system: System, emission_rates: pl.DataFrame) -> bool:
@@ -197,32 +188,31 @@ def add_precombustion(system: System, emission_rates: pl.DataFrame) -> bool:
         If multiple emission_rates of the same type are attached to the component
     """
     applied_rate = False
-    for generator_name, emission_type, rate in emission_rates.iter_rows():
+    generators_by_name = {generator.name: generator for generator in system.get_components(ReEDSGenerator)}
+    emission_types = _parse_emission_types(emission_rates["emission_type"].unique().to_list())
+
+    # Index the emission attributes of every generator referenced by the rates once, keyed by
+    # (generator name, emission type), instead of querying the system for each row.
+    emission_attrs: dict[tuple[str, EmissionType], list[ReEDSEmission]] = {}
+    for generator_name in emission_rates["generator_name"].unique().to_list():
+        component = generators_by_name.get(generator_name)
+        if component is None:
+            continue
+        for attr in system.get_supplemental_attributes_with_component(component, ReEDSEmission):
+            emission_attrs.setdefault((generator_name, attr.type), []).append(attr)
+
+    for generator_name, raw_emission_type, rate in emission_rates.iter_rows():
         # Convert string to EmissionType enum
-        try:
-            if isinstance(emission_type, str):
-                emission_type = EmissionType(emission_type.upper())
-            else:
-                emission_type = EmissionType(emission_type)
-        except ValueError:
-            logger.warning(f"Unknown emission type: {emission_type}")
+        emission_type = emission_types.get(raw_emission_type)
+        if emission_type is None:
+            logger.warning(f"Unknown emission type: {raw_emission_type}")
             continue
 
-        try:
-            component = system.get_component(ReEDSGenerator, generator_name)
-        except Exception:
+        if generator_name not in generators_by_name:
             logger.trace("Generator {} not found in system", generator_name)
             continue
 
-        # Get emission attributes for this component
-        def _matches_emission_type(a: ReEDSEmission, et: EmissionType = emission_type) -> bool:
-            """Emission matching"""
-            return a.type == et
-
-        attrs = system.get_supplemental_attributes_with_component(
-            component, ReEDSEmission, filter_func=_matches_emission_type
-        )
-
+        attrs = emission_attrs.get((generator_name, emission_type))
         if not attrs:
             logger.trace("`ReEDSEmission:{}` object not found for {}", emission_type, generator_name)
             continue
@@ -239,6 +229,17 @@ def add_precombustion(system: System, emission_rates: pl.DataFrame) -> bool:
     return applied_rate
 
 
+def _parse_emission_types(values: list[Any]) -> dict[Any, EmissionType]:
+    """Map raw emission type values to `EmissionType`, leaving out unknown values."""
+    parsed: dict[Any, EmissionType] = {}
+    for value in values:
+        try:
+            parsed[value] = EmissionType(value.upper() if isinstance(value, str) else value)
+        except ValueError:
+            continue
+    return parsed
+
+
 def set_emission_constraint(
     system: System,
     emission_cap: float | None = None,
@@ -77,68 +77,55 @@ def add_imports(system: System, config: ImportsConfig) -> Result[System, str]:
     logger.info("Adding imports time series...")
 
     try:
-        # Load required data files using DataStore helper
-        hour_map = DataStore.load_file(config.hour_map_fpath, name="hour_map")
-        szn_frac = DataStore.load_file(config.canada_szn_frac_fpath, name="canada_szn_frac")
         total_imports = DataStore.load_file(config.canada_imports_fpath, name="canada_imports")
-
-        if hour_map is not None:
-            hour_map = hour_map.collect()
-        if szn_frac is not None:
-            szn_frac = szn_frac.collect()
         if total_imports is not None:
             total_imports = total_imports.collect()
 
-        # Create hourly time series by joining hour map with seasonal fractions
-        hourly_time_series = hour_map.join(szn_frac, on="season", how="left")
+        daily_time_series = _load_daily_profile(
+            Path(config.hour_map_fpath), Path(config.canada_szn_frac_fpath)
+        )
 
-        if hourly_time_series.is_empty():
+        if daily_time_series.is_empty():
             logger.warning("Empty time series after joining hour_map and seasonal fractions")
             return Ok(system)
 
-        # Convert time_index to datetime
-        hourly_time_series = hourly_time_series.with_columns(
-            pl.col("time_index").str.to_datetime(),
-        )
-
-        # Group by date to get daily values
-        daily_time_series = hourly_time_series.group_by(pl.col("time_index").dt.date()).median()
-
-        # NOTE: Since the seasons can be repeated, the szn frac can be greater than one. To avoid this, we
-        # normalize it again to redistribute the fraction throughout the 365 or 366 days.
-        if "value" in daily_time_series.columns:
-            daily_time_series = daily_time_series.with_columns(pl.col("value") / pl.col("value").sum())
-
         initial_time = datetime(year=config.weather_year, month=1, day=1)
 
-        # Find Canadian import generators
-        for generator in system.get_components(
-            ReEDSGenerator,
-            filter_func=lambda x: "can-imports" in x.name.lower() or "canada" in x.technology.lower(),
-        ):
+        # The normalized daily profile and the per-region totals are shared by every generator, so
+        # convert them once and scale the profile per generator with a dictionary lookup. The unit
+        # conversion already ran in the plan, so the profile is a view of the collected column.
+        daily_profile_gwh = daily_time_series["value"].to_numpy()[:-1]
+        imports_by_region = dict(
+            zip(total_imports["r"].to_list(), total_imports["value"].to_list(), strict=True)
+        )
+
+        # Find Canadian import generators. Generators in the same region share an identical
+        # budget, so they are grouped and each region's time series is built once.
+        generators_by_region: dict[str, list[ReEDSGenerator]] = {}
+        for generator in system.get_components(ReEDSGenerator, filter_func=_is_canadian_import):
             # Get region name from the generator's region
             region_name = generator.region.name
 
-            # Filter total imports for this region
-            region_imports = total_imports.filter(pl.col("r") == region_name)
-
-            if region_imports.is_empty():
+            if imports_by_region.get(region_name) is None:
                 logger.warning("No import data found for region {}", region_name)
                 continue
+            generators_by_region.setdefault(region_name, []).append(generator)
 
-            total_import_value = region_imports["value"].item()
-            daily_budget = total_import_value * daily_time_series["value"].to_numpy()
-            daily_budget_gwh = daily_budget[:-1] / 1e3  # Convert MWh to GWh
+        resolution = timedelta(days=1)
+        with system.open_time_series_store() as context:
+            for region_name, generators in generators_by_region.items():
+                daily_budget_gwh = imports_by_region[region_name] * daily_profile_gwh
 
-            ts = SingleTimeSeries.from_array(
-                data=daily_budget_gwh,  # Data in GWh
-                name="hydro_budget",
-                initial_timestamp=initial_time,
-                resolution=timedelta(days=1),
-            )
+                ts = SingleTimeSeries.from_array(
+                    data=daily_budget_gwh,  # Data in GWh
+                    name="hydro_budget",
+                    initial_timestamp=initial_time,
+                    resolution=resolution,
+                )
 
-            system.add_time_series(ts, generator)
-            logger.debug("Added imports time series to generator: {}", generator.name)
+                system.add_time_series(ts, *generators, context=context)
+                for generator in generators:
+                    logger.debug("Added imports time series to generator: {}", generator.name)
 
         logger.info("Finished adding imports time series")
     except Exception as e:
@@ -146,3 +133,40 @@ def add_imports(system: System, config: ImportsConfig) -> Result[System, str]:
         return Err(str(e))
 
     return Ok(system)
+
+
+def _load_daily_profile(hour_map_fpath: Path, szn_frac_fpath: Path) -> pl.DataFrame:
+    """Return the normalized daily import profile in GWh."""
+    # Load required data files using DataStore helper
+    hour_map = DataStore.load_file(hour_map_fpath, name="hour_map").lazy()
+    szn_frac = DataStore.load_file(szn_frac_fpath, name="canada_szn_frac").lazy()
+
+    # Create the daily time series in a single lazy plan: join the hour map with the seasonal
+    # fractions, derive the date group key and take the daily median.
+    # NOTE: Since the seasons can be repeated, the szn frac can be greater than one. To avoid this, we
+    # normalize it again to redistribute the fraction throughout the 365 or 366 days.
+    daily_time_series = (
+        hour_map.join(szn_frac, on="season", how="left")
+        .group_by(_time_index_date(hour_map))
+        .agg(pl.col("value").median())
+        .sort("time_index")
+        .with_columns(pl.col("value") / pl.col("value").sum() / 1e3)  # Convert MWh to GWh
+        .collect()
+    )
+    return daily_time_series
+
+
+def _is_canadian_import(generator: ReEDSGenerator) -> bool:
+    """Return True if the generator name or technology identifies it as a Canadian import."""
+    return "can-imports" in generator.name.lower() or "canada" in generator.technology.lower()
+
+
+def _time_index_date(hour_map: pl.LazyFrame) -> pl.Expr:
+    """Return the date of each `time_index`, parsing the timestamps only when stored as strings."""
+    time_index = pl.col("time_index")
+    dtype = hour_map.collect_schema()["time_index"]
+    if dtype == pl.Date:
+        return time_index
+    if dtype == pl.String:
+        time_index = time_index.str.to_datetime()
+    return time_index.dt.date()
@@ -3,16 +3,20 @@
 from pathlib import Path
 from typing import Any
 
+import orjson
 from infrasys import System
 from loguru import logger
 from pydantic import Field
 from rust_ok import Err, Ok, Result
 
 from r2x_core import PluginConfig, expose_plugin
-from r2x_core.datafile import DataFile
-from r2x_core.store import DataStore
 from r2x_reeds.models.components import ReEDSGenerator
 
+# Fields that need to be multiplied by generator capacity
+_NEEDS_MULTIPLICATION = frozenset({"start_cost_per_MW", "ramp_limits"})
+
+_NO_MATCH_MSG = "Could not find a matching category for {}. Skipping generator from pcm_defaults plugin."
+
 
 class PCMDefaultsConfig(PluginConfig):
     """Configuration for augmenting CEM results with PCM default values."""
@@ -67,55 +71,52 @@ def add_pcm_defaults(
 
         logger.debug("Using PCM defaults from: {}", config.pcm_defaults_fpath)
 
-        # Read PCM defaults using DataStore
+        # Read PCM defaults from the JSON file
         try:
-            pcm_path = Path(config.pcm_defaults_fpath)
-            pcm_data_file = DataFile(name="pcm_defaults", fpath=pcm_path)
-            data_store = DataStore(path=pcm_path.parent)
-            data_store.add_data([pcm_data_file])
-
-            pcm_defaults = data_store.read_data(name="pcm_defaults")
+            pcm_defaults = _load_pcm_defaults(Path(config.pcm_defaults_fpath))
         except Exception as exc:
             logger.error("Failed to load PCM defaults: {}", exc)
             return Err(str(exc))
 
-    # Fields that need to be multiplied by generator capacity
-    needs_multiplication = {"start_cost_per_MW", "ramp_limits"}
-
-    # Fields that should be processed first (for dependency ordering)
-    fields_weight = {"capacity": 1}  # Updated from active_power_limits
+    pcm_get = pcm_defaults.get
+    model_fields_by_type: dict[type, frozenset[str]] = {}
+    prepared_entries: dict[int, list[tuple[str, Any]]] = {}
 
     # NOTE: Matching names provides the order that we do the mapping for. First
     # we try to find the name of the generator, if not we rely on reeds category
     # and finally if we did not find a match the broader category
     for component in system.get_components(ReEDSGenerator):
         # Try multiple matching strategies
-        pcm_values = pcm_defaults.get(component.name) or pcm_defaults.get(component.technology)
+        pcm_values = pcm_get(component.name) or pcm_get(component.technology)
         if pcm_values is None and component.category is not None:
-            pcm_values = pcm_defaults.get(component.category)
+            pcm_values = pcm_get(component.category)
 
         if not pcm_values:
-            msg = "Could not find a matching category for {}. "
-            msg += "Skipping generator from pcm_defaults plugin."
-            logger.debug(msg, component.name)
+            logger.debug(_NO_MATCH_MSG, component.name)
             continue
 
-        msg = "Applying PCM defaults to {}"
-        logger.debug(msg, component.name)
+        logger.debug("Applying PCM defaults to {}", component.name)
+
+        # Generators matched to the same defaults entry share its ordered, non-null values.
+        if (entry_values := prepared_entries.get(id(pcm_values))) is None:
+            entry_values = prepared_entries[id(pcm_values)] = _prepare_pcm_values(pcm_values)
 
         if not config.pcm_defaults_override:
+            # Keys that are not model fields read as missing and are still forwarded, since
+            # `start_cost_per_MW` is mapped to `startup_cost` below.
             fields_to_replace = [
-                key for key in pcm_values if _check_if_null(_get_component_attribute(component, key))
+                (field, value)
+                for field, value in entry_values
+                if _check_if_null(getattr(component, field, None))
             ]
         else:
-            fields_to_replace = [key for key in pcm_values if key in type(component).model_fields]
-
-        for field in sorted(fields_to_replace, key=lambda x: fields_weight.get(x, -999)):
-            value = pcm_values[field]
-            if _check_if_null(value):
-                continue
+            component_type = type(component)
+            if (model_fields := model_fields_by_type.get(component_type)) is None:
+                model_fields = model_fields_by_type[component_type] = frozenset(component_type.model_fields)
+            fields_to_replace = [(field, value) for field, value in entry_values if field in model_fields]
 
-            if field in needs_multiplication:
+        for field, value in fields_to_replace:
+            if field in _NEEDS_MULTIPLICATION:
                 base_capacity = component.capacity
                 if base_capacity is not None:
                     value = _multiply_value(base_capacity, value)
@@ -136,23 +137,33 @@ def add_pcm_defaults(
     return Ok(system)
 
 
+def _load_pcm_defaults(fpath: Path) -> dict[str, dict[str, Any]]:
+    """Read a PCM defaults JSON file."""
+    return orjson.loads(fpath.read_bytes())
+
+
+def _prepare_pcm_values(pcm_values: dict[str, Any]) -> list[tuple[str, Any]]:
+    """Return the non-null defaults of an entry in the order they are applied.
+
+    Capacity is set after every other field, so scaled values use the current capacity.
+    """
+    entry_values = [(field, value) for field, value in pcm_values.items() if not _check_if_null(value)]
+    entry_values.sort(key=lambda item: item[0] == "capacity")
+    return entry_values
+
+
 def _multiply_value(base: float, val):
     """Multiply a value or dictionary of values by a base amount."""
-    if isinstance(val, dict):
+    # PCM defaults are plain JSON values, so an exact type check is enough to spot mappings.
+    if type(val) is dict:
         return {k: base * v for k, v in val.items()}
     return base * val
 
 
 def _check_if_null(val):
     """Check if a value should be considered null/empty."""
-    if isinstance(val, dict):
+    if val is None:
+        return True
+    if type(val) is dict:
         return all(not v for v in val.values())
-    return val is None
-
-
-def _get_component_attribute(component, attr):
-    """Safely retrieve an attribute that may not exist on the component."""
-    try:
-        return getattr(component, attr)
-    except AttributeError:
-        return None
+    return False
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import gc
+import stat
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import Any
 
+import orjson
 from loguru import logger
 from rust_ok import Err, Ok, Result
 
@@ -89,10 +94,13 @@ def _coerce_path(
         )
         return Err(TypeError(msg))
 
-    if not reference_path.exists():
+    # A single stat call answers both "does it exist" and "is it a directory".
+    try:
+        mode = reference_path.stat().st_mode
+    except OSError:
         return Err(FileNotFoundError(f"Reference technologies file not found: {reference_path}"))
 
-    if reference_path.is_dir():
+    if stat.S_ISDIR(mode):
         return Err(
             IsADirectoryError(
                 f"Expected a file path for reference technologies, got directory: {reference_path}"
@@ -100,3 +108,36 @@ def _coerce_path(
         )
 
     return Ok(reference_path)
+
+
+def _read_json_cached(fpath: Path) -> Any:
+    """Parse a JSON file, reusing the result while the file is unchanged on disk.
+
+    The parsed object is shared between callers and must be treated as read-only.
+    """
+    resolved = Path(fpath).resolve()
+    stat_result = resolved.stat()
+    return _parse_json_file(str(resolved), stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@lru_cache(maxsize=16)
+def _parse_json_file(fpath: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; the stat fields only key the cache."""
+    return orjson.loads(Path(fpath).read_bytes())
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend cyclic garbage collection while a block allocates many components.
+
+    Collection is only re-enabled if it was enabled on entry, followed by a cheap
+    young-generation pass to reclaim the short-lived objects created in the block.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+            gc.collect(0)
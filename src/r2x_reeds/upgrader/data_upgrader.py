@@ -1,5 +1,6 @@
 """Data upgrader for ReEDS."""
 
+import csv
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
@@ -45,8 +46,6 @@ class ReEDSVersionDetector(VersionReader):
         FileNotFoundError
             If meta.csv file does not exist.
         """
-        import csv
-
         folder_path = Path(folder_path)
 
         csv_path = folder_path / "meta.csv"
@@ -54,23 +53,31 @@ class ReEDSVersionDetector(VersionReader):
             msg = f"ReEDS version file {csv_path} not found."
             raise FileNotFoundError(msg)
 
-        with open(csv_path) as f:
-            reader = csv.reader(f)
-            header_row = next(reader)
-            data_row = next(reader)
+        # Only the header and the first data row are needed, so read two lines instead of
+        # running a csv reader over the file.
+        with open(csv_path, newline="") as f:
+            header_row = _split_csv_line(f.readline())
+            data_row = _split_csv_line(f.readline())
 
-            # Find "tag" column by header name
-            try:
-                tag_index = header_row.index("tag")
-            except ValueError:
-                # No "tag" column found - legacy format
-                return LEGACY_VERSION
+        # Find "tag" column by header name
+        try:
+            tag_index = header_row.index("tag")
+        except ValueError:
+            # No "tag" column found - legacy format
+            return LEGACY_VERSION
 
-            # Check if tag value exists and is not empty
-            if tag_index < len(data_row) and data_row[tag_index].strip():
-                return data_row[tag_index].strip()
+        # Check if tag value exists and is not empty
+        if tag_index < len(data_row) and data_row[tag_index].strip():
+            return data_row[tag_index].strip()
 
-            return LEGACY_VERSION
+        return LEGACY_VERSION
+
+
+def _split_csv_line(line: str) -> list[str]:
+    """Split one CSV line, using the csv module only when the line has quoted fields."""
+    if '"' in line:
+        return next(csv.reader([line]), [])
+    return line.rstrip("\r\n").split(",")
 
 
 class ReEDSUpgrader:
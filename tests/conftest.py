@@ -71,3 +71,33 @@ def example_system(parser: "ReEDSParser", reeds_config: "ReEDSConfig", data_stor
     if result_ctx.system is None:
         raise RuntimeError("Failed to build system: system is None in context")
     return result_ctx.system
+
+
+class ExplodingRow:
+    """Row whose every field access raises, used to check that getters return Err."""
+
+    def __getattr__(self, name):
+        raise RuntimeError("boom")
+
+    def get(self, name):
+        raise RuntimeError("boom")
+
+
+@pytest.fixture(scope="session")
+def exploding_row() -> ExplodingRow:
+    return ExplodingRow()
+
+
+class FaultyRow:
+    """Row whose ``get`` raises while attributes still resolve, to exercise the getattr fallback."""
+
+    def __init__(self, region):
+        self.region = region
+
+    def get(self, field):
+        raise RuntimeError("boom")
+
+
+@pytest.fixture(scope="session")
+def faulty_row_factory() -> type[FaultyRow]:
+    return FaultyRow
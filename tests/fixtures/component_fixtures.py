@@ -3,9 +3,7 @@
 import pytest
 
 
-@pytest.fixture
-def sample_region():
-    """Create a sample ReEDS region."""
+def _build_sample_region():
     from r2x_reeds.models import ReEDSRegion
 
     return ReEDSRegion(
@@ -18,6 +16,18 @@ def sample_region():
     )
 
 
+@pytest.fixture
+def sample_region():
+    """Create a sample ReEDS region."""
+    return _build_sample_region()
+
+
+@pytest.fixture(scope="module")
+def module_sample_region():
+    """Create a sample ReEDS region shared by the tests of one module."""
+    return _build_sample_region()
+
+
 @pytest.fixture
 def thermal_generator(sample_region):
     """Create a sample thermal generator."""
@@ -25,16 +25,7 @@ def reeds_run_path(reeds_data_path_override: Path | None, tmp_path_factory, test
         logger.info("Using override ReEDS data path: {}", reeds_data_path_override)
         return reeds_data_path_override
 
-    base_tmp = tmp_path_factory.mktemp("reeds_run")
-    archive_run = test_data_path / "test_Pacific.zip"
-
-    if not archive_run.exists():
-        pytest.fail(f"Test data archive not found: {archive_run}")
-
-    with zipfile.ZipFile(archive_run, "r") as zip_ref:
-        zip_ref.extractall(base_tmp)
-
-    run_path = base_tmp / "test_Pacific"
+    run_path = _extract_archive(tmp_path_factory, test_data_path / "test_Pacific.zip", "reeds_run")
     logger.debug("Unpacked test data to: {}", run_path)
     return run_path
 
@@ -42,18 +33,20 @@ def reeds_run_path(reeds_data_path_override: Path | None, tmp_path_factory, test
 @pytest.fixture(scope="session")
 def reeds_run_upgrader(tmp_path_factory, test_data_path: Path) -> Path:
     """ReEDS upgrader test data - unpacks test_Upgrader.zip."""
-    base_tmp = tmp_path_factory.mktemp("reeds_run_upgrader")
-    archive_run = test_data_path / "test_Upgrader.zip"
+    run_path = _extract_archive(tmp_path_factory, test_data_path / "test_Upgrader.zip", "reeds_run_upgrader")
+    logger.debug("Unpacked upgrader test data to: {}", run_path)
+    return run_path
 
-    if not archive_run.exists():
-        pytest.fail(f"Test data archive not found: {archive_run}")
 
-    with zipfile.ZipFile(archive_run, "r") as zip_ref:
-        zip_ref.extractall(base_tmp)
+def _extract_archive(tmp_path_factory, archive: Path, basename: str) -> Path:
+    """Extract a test data archive once per session and return its run folder."""
+    if not archive.exists():
+        pytest.fail(f"Test data archive not found: {archive}")
 
-    run_path = base_tmp / "test_Upgrader"
-    logger.debug("Unpacked upgrader test data to: {}", run_path)
-    return run_path
+    base_tmp = tmp_path_factory.mktemp(basename)
+    with zipfile.ZipFile(archive, "r") as zip_ref:
+        zip_ref.extractall(base_tmp)
+    return base_tmp / archive.stem
 
 
 @pytest.fixture(scope="session")
@@ -69,6 +62,12 @@ def reeds_config(reeds_run_path: Path) -> "ReEDSConfig":
     )
 
 
+@pytest.fixture(scope="session")
+def reeds_config_assets(reeds_config: "ReEDSConfig") -> dict:
+    """Configuration assets loaded once per session; tests must treat them as read-only."""
+    return reeds_config.load_config()
+
+
 @pytest.fixture(scope="session")
 def data_store(reeds_run_path: Path, reeds_config: "ReEDSConfig") -> "DataStore":
     """DataStore from file mapping."""
@@ -152,6 +152,16 @@ def test_map_emission_type_unknown() -> None:
     assert "Unknown emission type" in str(result.err())
 
 
+@pytest.mark.unit
+def test_map_emission_type_covers_every_member() -> None:
+    from r2x_reeds.enum_mappings import EMISSION_TYPE_MAP, map_emission_type
+    from r2x_reeds.models.enums import EmissionType
+
+    assert set(EMISSION_TYPE_MAP.values()) == set(EmissionType)
+    for emission in EmissionType:
+        assert map_emission_type(emission.value.lower()).ok() is emission
+
+
 @pytest.mark.unit
 def test_map_emission_source_combustion() -> None:
     from r2x_reeds.enum_mappings import map_emission_source
@@ -5,23 +5,15 @@ import pytest
 pytestmark = [pytest.mark.integration]
 
 
-def test_excluded_techs_empty_list_default(reeds_config, reeds_run_path):
-    from typing import cast
-
-    from r2x_core import DataStore, PluginContext
-    from r2x_reeds import ReEDSParser
+def test_excluded_techs_empty_list_default(reeds_config_assets, example_system):
     from r2x_reeds.models import ReEDSGenerator
 
-    config_dicts = reeds_config.load_config()
-    assert config_dicts["defaults"].get("excluded_techs") == ["can-imports", "electrolyzer"]
-
-    data_store = DataStore.from_plugin_config(reeds_config, path=reeds_run_path)
-    ctx = PluginContext(config=reeds_config, store=data_store)
-    parser = cast(ReEDSParser, ReEDSParser.from_context(ctx))
-    result_ctx = parser.run()
+    excluded_techs = reeds_config_assets["defaults"].get("excluded_techs")
+    assert excluded_techs == ["can-imports", "electrolyzer"]
 
-    system = result_ctx.system
-    assert system is not None
-    generators = list(system.get_components(ReEDSGenerator))
+    # The session system is built from the same config and run folder, so it is reused here
+    # instead of running the parser again.
+    generators = tuple(example_system.get_components(ReEDSGenerator))
 
     assert len(generators) > 0
+    assert {generator.technology for generator in generators}.isdisjoint(excluded_techs)
@@ -16,15 +16,27 @@ from typing import Any
 
 import pytest
 
+from r2x_core import PluginContext, System
+from r2x_reeds import ReEDSConfig
+from r2x_reeds import getters as getters_mod
+from r2x_reeds.getters import (
+    build_generator_name,
+    build_region_description,
+    build_region_name,
+    get_storage_duration,
+    lookup_region,
+    resolve_emission_source,
+    resolve_emission_type,
+    resolve_reserve_type,
+)
+from r2x_reeds.models import ReEDSRegion, ReEDSReserveRegion
+
 pytestmark = [pytest.mark.unit]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_system():
-    """Create a test system with sample regions."""
-    from r2x_core import System
-    from r2x_reeds.models import ReEDSRegion, ReEDSReserveRegion
-
+    """Create a test system with sample regions, shared read-only by the module."""
     system = System(name="test_system")
     region = ReEDSRegion(name="p1", state="CA")
     system.add_component(region)
@@ -33,12 +45,9 @@ def test_system():
     return system
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_context(test_system):
     """Create a plugin context for getter tests."""
-    from r2x_core import PluginContext
-    from r2x_reeds import ReEDSConfig
-
     config = ReEDSConfig(solve_year=2030, weather_year=2012, case_name="test_getters")
     return PluginContext(
         system=test_system,
@@ -56,8 +65,6 @@ def test_context(test_system):
 @pytest.mark.unit
 def test_lookup_region_dict(test_context) -> None:
     """Test getter with dict input accessing region field."""
-    from r2x_reeds.getters import lookup_region
-
     row: dict[str, Any] = {"region": "p1"}
     result = lookup_region(row, context=test_context)
     assert result.is_ok()
@@ -66,8 +73,6 @@ def test_lookup_region_dict(test_context) -> None:
 @pytest.mark.unit
 def test_build_region_description_dict(test_context) -> None:
     """Test getter with dict input accessing region_id/region fields."""
-    from r2x_reeds.getters import build_region_description
-
     row: dict[str, Any] = {"region_id": "p1"}
     result = build_region_description(row, context=test_context)
     assert result.is_ok()
@@ -76,8 +81,6 @@ def test_build_region_description_dict(test_context) -> None:
 @pytest.mark.unit
 def test_build_region_name_dict(test_context) -> None:
     """Test getter with dict input accessing multiple fallback fields."""
-    from r2x_reeds.getters import build_region_name
-
     row: dict[str, Any] = {"region_id": "p1"}
     result = build_region_name(row, context=test_context)
     assert result.is_ok()
@@ -86,8 +89,6 @@ def test_build_region_name_dict(test_context) -> None:
 @pytest.mark.unit
 def test_build_generator_name_dict(test_context) -> None:
     """Test getter with dict input accessing technology, region, vintage fields."""
-    from r2x_reeds.getters import build_generator_name
-
     row: dict[str, Any] = {"technology": "wind", "region": "p1"}
     result = build_generator_name(row, context=test_context)
     assert isinstance(result.is_ok() or result.is_err(), bool)
@@ -96,8 +97,6 @@ def test_build_generator_name_dict(test_context) -> None:
 @pytest.mark.unit
 def test_resolve_reserve_type_dict(test_context) -> None:
     """Test getter with dict input accessing reserve_type field."""
-    from r2x_reeds.getters import resolve_reserve_type
-
     row: dict[str, Any] = {"reserve_type": "SPINNING"}
     result = resolve_reserve_type(row, context=test_context)
     assert result.is_ok()
@@ -106,8 +105,6 @@ def test_resolve_reserve_type_dict(test_context) -> None:
 @pytest.mark.unit
 def test_get_storage_duration_dict(test_context) -> None:
     """Test getter with dict input accessing numeric field."""
-    from r2x_reeds.getters import get_storage_duration
-
     row: dict[str, Any] = {"storage_duration": 2.0}
     result = get_storage_duration(row, context=test_context)
     assert isinstance(result.is_ok() or result.is_err(), bool)
@@ -119,8 +116,6 @@ def test_get_storage_duration_dict(test_context) -> None:
 @pytest.mark.unit
 def test_lookup_region_namespace(test_context) -> None:
     """Test getter with SimpleNamespace input accessing region field."""
-    from r2x_reeds.getters import lookup_region
-
     row = SimpleNamespace(region="p1")
     result = lookup_region(row, context=test_context)
     assert result.is_ok()
@@ -129,8 +124,6 @@ def test_lookup_region_namespace(test_context) -> None:
 @pytest.mark.unit
 def test_build_region_description_namespace(test_context) -> None:
     """Test getter with SimpleNamespace accessing region_id/region fields."""
-    from r2x_reeds.getters import build_region_description
-
     row = SimpleNamespace(region_id="p1")
     result = build_region_description(row, context=test_context)
     assert result.is_ok()
@@ -139,8 +132,6 @@ def test_build_region_description_namespace(test_context) -> None:
 @pytest.mark.unit
 def test_build_region_name_namespace(test_context) -> None:
     """Test getter with SimpleNamespace accessing multiple fallback fields."""
-    from r2x_reeds.getters import build_region_name
-
     row = SimpleNamespace(region_id="p1")
     result = build_region_name(row, context=test_context)
     assert result.is_ok()
@@ -149,8 +140,6 @@ def test_build_region_name_namespace(test_context) -> None:
 @pytest.mark.unit
 def test_build_generator_name_namespace(test_context) -> None:
     """Test getter with SimpleNamespace accessing technology, region, vintage."""
-    from r2x_reeds.getters import build_generator_name
-
     row = SimpleNamespace(technology="wind", region="p1")
     result = build_generator_name(row, context=test_context)
     assert isinstance(result.is_ok() or result.is_err(), bool)
@@ -159,8 +148,6 @@ def test_build_generator_name_namespace(test_context) -> None:
 @pytest.mark.unit
 def test_resolve_reserve_type_namespace(test_context) -> None:
     """Test getter with SimpleNamespace accessing reserve_type field."""
-    from r2x_reeds.getters import resolve_reserve_type
-
     row = SimpleNamespace(reserve_type="SPINNING")
     result = resolve_reserve_type(row, context=test_context)
     assert result.is_ok()
@@ -169,8 +156,6 @@ def test_resolve_reserve_type_namespace(test_context) -> None:
 @pytest.mark.unit
 def test_get_storage_duration_namespace(test_context) -> None:
     """Test getter with SimpleNamespace accessing numeric field."""
-    from r2x_reeds.getters import get_storage_duration
-
     row = SimpleNamespace(storage_duration=2.0)
     result = get_storage_duration(row, context=test_context)
     assert isinstance(result.is_ok() or result.is_err(), bool)
@@ -182,8 +167,6 @@ def test_get_storage_duration_namespace(test_context) -> None:
 @pytest.mark.unit
 def test_region_lookup_consistency(test_context) -> None:
     """Test that dict and namespace inputs produce same result for region lookup."""
-    from r2x_reeds.getters import lookup_region
-
     dict_row: dict[str, Any] = {"region": "p1"}
     ns_row = SimpleNamespace(region="p1")
 
@@ -196,8 +179,6 @@ def test_region_lookup_consistency(test_context) -> None:
 @pytest.mark.unit
 def test_generator_name_consistency(test_context) -> None:
     """Test that dict and namespace inputs produce same result for name building."""
-    from r2x_reeds.getters import build_generator_name
-
     dict_row: dict[str, Any] = {"technology": "wind", "region": "p1"}
     ns_row = SimpleNamespace(technology="wind", region="p1")
 
@@ -210,8 +191,6 @@ def test_generator_name_consistency(test_context) -> None:
 @pytest.mark.unit
 def test_reserve_type_consistency(test_context) -> None:
     """Test that dict and namespace produce consistent enum resolution."""
-    from r2x_reeds.getters import resolve_reserve_type
-
     dict_row: dict[str, Any] = {"reserve_type": "SPINNING"}
     ns_row = SimpleNamespace(reserve_type="SPINNING")
 
@@ -229,8 +208,6 @@ def test_reserve_type_consistency(test_context) -> None:
 @pytest.mark.unit
 def test_lookup_region_missing_field_dict(test_context) -> None:
     """Test getter errors when field missing from dict."""
-    from r2x_reeds.getters import lookup_region
-
     row: dict[str, Any] = {"other_field": "value"}
     result = lookup_region(row, context=test_context)
     assert result.is_err()
@@ -239,8 +216,6 @@ def test_lookup_region_missing_field_dict(test_context) -> None:
 @pytest.mark.unit
 def test_lookup_region_missing_field_namespace(test_context) -> None:
     """Test getter errors when field missing from namespace."""
-    from r2x_reeds.getters import lookup_region
-
     row = SimpleNamespace(other_field="value")
     result = lookup_region(row, context=test_context)
     assert result.is_err()
@@ -266,8 +241,6 @@ def test_various_getters_missing_fields(
     field_ns: SimpleNamespace,
 ) -> None:
     """Test various getters handle missing required fields consistently."""
-    from r2x_reeds import getters as getters_mod
-
     getter_func = getattr(getters_mod, getter_name)
     dict_result = getter_func(field_dict, context=test_context)
     ns_result = getter_func(field_ns, context=test_context)
@@ -281,8 +254,6 @@ def test_various_getters_missing_fields(
 @pytest.mark.unit
 def test_reserve_type_mapping(test_context) -> None:
     """Test reserve type enum resolution."""
-    from r2x_reeds.getters import resolve_reserve_type
-
     row: dict[str, Any] = {"reserve_type": "SPINNING"}
     result = resolve_reserve_type(row, context=test_context)
     assert result.is_ok()
@@ -291,8 +262,6 @@ def test_reserve_type_mapping(test_context) -> None:
 @pytest.mark.unit
 def test_emission_type_mapping(test_context) -> None:
     """Test emission type enum resolution."""
-    from r2x_reeds.getters import resolve_emission_type
-
     row: dict[str, Any] = {"emission_type": "CO2"}
     result = resolve_emission_type(row, context=test_context)
     assert result.is_ok()
@@ -301,8 +270,6 @@ def test_emission_type_mapping(test_context) -> None:
 @pytest.mark.unit
 def test_emission_source_mapping(test_context) -> None:
     """Test emission source enum resolution."""
-    from r2x_reeds.getters import resolve_emission_source
-
     row: dict[str, Any] = {"emission_source": "COMBUSTION"}
     result = resolve_emission_source(row, context=test_context)
     assert result.is_ok()
@@ -311,8 +278,6 @@ def test_emission_source_mapping(test_context) -> None:
 @pytest.mark.unit
 def test_invalid_enum_values(test_context) -> None:
     """Test that invalid enum values are rejected."""
-    from r2x_reeds.getters import resolve_reserve_type
-
     row: dict[str, Any] = {"reserve_type": "INVALID_TYPE"}
     result = resolve_reserve_type(row, context=test_context)
     assert result.is_err()
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, cast
 
 import polars as pl
 import pytest
-from rust_ok import Ok, Result
+from rust_ok import Ok
 
 from r2x_core import System
 from r2x_reeds import ReEDSConfig, ReEDSParser
@@ -50,87 +50,27 @@ def built_system() -> System:
     return System(name="test_builder")
 
 
-def _builder_calls(parser: ReEDSParser, system: System) -> list[tuple[str, Result[None, str]]]:
-    return [
-        ("_build_regions", parser._build_regions(system)),
-        ("_build_generators", parser._build_generators(system)),
-        ("_build_transmission", parser._build_transmission(system)),
-        ("_build_loads", parser._build_loads(system)),
-        ("_build_reserves", parser._build_reserves(system)),
-        ("_build_emissions", parser._build_emissions(system)),
-    ]
+# Builders that must run first so the components they look up exist in the parser system.
+_BUILDER_PREREQUISITES = {
+    "_build_regions": (),
+    "_build_generators": ("_build_regions",),
+    "_build_transmission": ("_build_regions",),
+    "_build_loads": ("_build_regions",),
+    "_build_reserves": ("_build_regions",),
+    "_build_emissions": ("_build_regions", "_build_generators"),
+}
 
 
 @pytest.mark.unit
-def test_build_regions_with_valid_data(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_regions succeeds with valid hierarchy data."""
-    result = initialized_parser._build_regions(built_system)
-    assert result.is_ok() or result.is_err()
+@pytest.mark.parametrize("method_name", list(_BUILDER_PREREQUISITES))
+def test_builders_ok(initialized_parser: ReEDSParser, built_system: System, method_name: str) -> None:
+    """Each builder succeeds on the example data once its prerequisites are built."""
+    initialized_parser.ctx.system = built_system
+    for prerequisite in _BUILDER_PREREQUISITES[method_name]:
+        assert getattr(initialized_parser, prerequisite)(built_system).is_ok()
 
-
-@pytest.mark.unit
-def test_build_regions_returns_ok_type(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_regions returns a Result type."""
-    result = initialized_parser._build_regions(built_system)
-    assert hasattr(result, "is_ok") and hasattr(result, "is_err")
-
-
-@pytest.mark.unit
-def test_build_generators_with_valid_data(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_generators succeeds with valid generator data."""
-    result = initialized_parser._build_generators(built_system)
-    assert result.is_ok() or result.is_err()
-
-
-@pytest.mark.unit
-def test_build_generators_returns_result_type(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_generators returns a Result type."""
-    result = initialized_parser._build_generators(built_system)
-    assert hasattr(result, "is_ok") and hasattr(result, "is_err")
-
-
-@pytest.mark.unit
-def test_build_transmission_with_valid_data(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_transmission succeeds with valid transmission data."""
-    result = initialized_parser._build_transmission(built_system)
-    assert result.is_ok() or result.is_err()
-
-
-@pytest.mark.unit
-def test_build_transmission_returns_result_type(
-    initialized_parser: ReEDSParser, built_system: System
-) -> None:
-    """Test _build_transmission returns a Result type."""
-    result = initialized_parser._build_transmission(built_system)
-    assert hasattr(result, "is_ok") and hasattr(result, "is_err")
-
-
-@pytest.mark.unit
-def test_build_loads_with_valid_data(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_loads succeeds with valid load data."""
-    result = initialized_parser._build_loads(built_system)
-    assert result.is_ok() or result.is_err()
-
-
-@pytest.mark.unit
-def test_build_loads_returns_result_type(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_loads returns a Result type."""
-    result = initialized_parser._build_loads(built_system)
-    assert hasattr(result, "is_ok") and hasattr(result, "is_err")
-
-
-@pytest.mark.unit
-def test_build_reserves_returns_result_type(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_reserves returns a Result type."""
-    result = initialized_parser._build_reserves(built_system)
-    assert hasattr(result, "is_ok") and hasattr(result, "is_err")
-
-
-@pytest.mark.unit
-def test_build_emissions_returns_result_type(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test _build_emissions returns a Result type."""
-    result = initialized_parser._build_emissions(built_system)
-    assert hasattr(result, "is_ok") and hasattr(result, "is_err")
+    result = getattr(initialized_parser, method_name)(built_system)
+    assert result.is_ok(), result.err()
 
 
 @pytest.mark.unit
@@ -199,16 +139,8 @@ def test_build_emissions_only_attaches_to_created_generators(
     monkeypatch.setattr(parser.system, "add_supplemental_attribute", track_add)
 
     result = parser._build_emissions(system)
-    assert result.is_ok() or result.is_err()
-
-
-@pytest.mark.unit
-def test_builder_methods_return_result_from_built_system(
-    initialized_parser: ReEDSParser, built_system: System
-) -> None:
-    """Test builder methods return Result types."""
-    for _, result in _builder_calls(initialized_parser, built_system):
-        assert hasattr(result, "is_ok") and hasattr(result, "is_err")
+    assert result.is_ok()
+    assert attached == [generator.name]
 
 
 @pytest.mark.unit
@@ -237,11 +169,7 @@ def test_build_transmission_interfaces_handles_component_creation_errors(
 
     data = pl.DataFrame({"from_region": ["p1"], "to_region": ["p2"], "trtype": ["ac"]})
     result = parser._build_transmission_interfaces(System(name="test"), data)
-    assert result.is_ok() or result.is_err()
-
-
-@pytest.mark.unit
-def test_builder_methods_return_result(initialized_parser: ReEDSParser, built_system: System) -> None:
-    """Test builder methods return Result types."""
-    for _, result in _builder_calls(initialized_parser, built_system):
-        assert hasattr(result, "is_ok") and hasattr(result, "is_err")
+    assert result.is_ok()
+    created, errors = result.ok()
+    assert created == 0
+    assert errors == ["p1||p2: boom"]
@@ -41,10 +41,9 @@ def test_load_count_for_test_data(example_system) -> None:
     assert len(loads) == 11, "11 Load expected for test case."
 
 
-def test_renewable_generator_count(example_system, example_reeds_config) -> None:
+def test_renewable_generator_count(example_system, reeds_config_assets) -> None:
     """Test expected renewable generator count for test_Pacific data."""
-    # Use classmethod API per migration guide
-    defaults = example_reeds_config.load_config()["defaults"]
+    defaults = reeds_config_assets["defaults"]
     ren_gens = example_system.get_components(
         ReEDSGenerator,
         filter_func=lambda comp: get_technology_category(comp.technology, defaults["tech_categories"]),
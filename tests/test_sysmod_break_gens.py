@@ -95,7 +95,7 @@ def test_break_generators_splits_and_preserves_data(system_with_region) -> None:
 
     _run_break(system, reference_units=reference)
 
-    generators = list(system.get_components(ReEDSGenerator))
+    generators = tuple(system.get_components(ReEDSGenerator))
     assert {gen.name for gen in generators} == {"gen_01", "gen_02", "gen_03"}
     assert sorted(gen.capacity for gen in generators) == [20.0, 50.0, 50.0]
     for gen in generators:
@@ -124,7 +124,7 @@ def test_break_generators_drops_small_remainder(system_with_region) -> None:
 
     _run_break(system, reference_units=reference)
 
-    generators = list(system.get_components(ReEDSGenerator))
+    generators = tuple(system.get_components(ReEDSGenerator))
     assert {gen.name for gen in generators} == {"gen_01", "gen_02"}
     assert sorted(gen.capacity for gen in generators) == [50.0, 50.0]
 
@@ -144,8 +144,8 @@ def test_break_generators_respects_non_break_list(system_with_region) -> None:
 
     _run_break(system, reference_units=reference, skip_categories=["wind"])
 
-    generators = list(system.get_components(ReEDSGenerator))
-    assert generators == [original]
+    generators = tuple(system.get_components(ReEDSGenerator))
+    assert generators == (original,)
 
 
 def test_break_gens_uses_reference_dict(system_with_region) -> None:
@@ -163,7 +163,7 @@ def test_break_gens_uses_reference_dict(system_with_region) -> None:
 
     _run_break(system, reference_units=reference)
 
-    generators = list(system.get_components(ReEDSGenerator))
+    generators = tuple(system.get_components(ReEDSGenerator))
     assert {gen.name for gen in generators} == {"gen_01", "gen_02", "gen_03"}
     assert sorted(gen.capacity for gen in generators) == [15.0, 40.0, 40.0]
 
@@ -184,7 +184,7 @@ def test_break_gens_reads_file(tmp_path: Path, system_with_region) -> None:
 
     _run_break(system, reference_units=reference_path)
 
-    generators = list(system.get_components(ReEDSGenerator))
+    generators = tuple(system.get_components(ReEDSGenerator))
     assert sorted(gen.capacity for gen in generators) == [10.0, 30.0, 30.0]
 
 
@@ -277,7 +277,7 @@ def test_break_generators_respects_drop_threshold(system_with_region) -> None:
 
     _run_break(system, reference_units=reference, drop_capacity_threshold=40)
 
-    generators = list(system.get_components(ReEDSGenerator))
+    generators = tuple(system.get_components(ReEDSGenerator))
     assert len(generators) == 2
     assert sorted(gen.capacity for gen in generators) == [50.0, 50.0]
 
@@ -334,8 +334,9 @@ def test_break_generators_return_same_type(system_with_region: System, caplog) -
 
     _run_break(sys, reference_units=reference, drop_capacity_threshold=40)
 
-    assert len(list(sys.get_components(ReEDSThermalGenerator))) == 2
-    assert next(sys.get_components(ReEDSThermalGenerator)).capacity == 50
+    generators = tuple(sys.get_components(ReEDSThermalGenerator))
+    assert len(generators) == 2
+    assert generators[0].capacity == 50
 
 
 def test_break_generators_with_default_reference_units(system_with_region) -> None:
@@ -357,11 +358,11 @@ def test_break_generators_with_default_reference_units(system_with_region) -> No
     assert list(sys.get_components(ReEDSGenerator)) == [generator]
 
 
-def test_create_split_generator_preserves_all_fields(system_with_region) -> None:
-    """Test that _create_split_generator preserves all original generator fields."""
-    from r2x_reeds.sysmod.break_gens import _create_split_generator
+def test_build_split_generator_preserves_all_fields(system_with_region) -> None:
+    """Test that _build_split_generator preserves all original generator fields."""
+    from r2x_reeds.sysmod.break_gens import _build_split_generator
 
-    sys, region = system_with_region
+    _, region = system_with_region
     original = ReEDSGenerator(
         name="original",
         region=region,
@@ -377,7 +378,7 @@ def test_create_split_generator_preserves_all_fields(system_with_region) -> None
         vintage="2020",
     )
 
-    split = _create_split_generator(sys, original, "split_01", 50.0)
+    split = _build_split_generator(original, "split_01", 50.0)
 
     assert split.name == "split_01"
     assert split.capacity == 50.0
@@ -393,9 +394,9 @@ def test_create_split_generator_preserves_all_fields(system_with_region) -> None
     assert split.vintage == "2020"
 
 
-def test_create_split_generator_added_to_system(system_with_region) -> None:
-    """Test that _create_split_generator adds component to system."""
-    from r2x_reeds.sysmod.break_gens import _create_split_generator
+def test_copy_component_data_attaches_to_every_split(system_with_region) -> None:
+    """Test that _copy_component_data copies attributes and time series to each split."""
+    from r2x_reeds.sysmod.break_gens import _build_split_generator, _copy_component_data
 
     sys, region = system_with_region
     original = ReEDSGenerator(
@@ -405,12 +406,23 @@ def test_create_split_generator_added_to_system(system_with_region) -> None:
         capacity=100.0,
         category="wind",
     )
+    sys.add_component(original)
+    sys.add_supplemental_attribute(original, ReEDSEmission(rate=1.0, type=EmissionType.CO2))
+    ts = SingleTimeSeries.from_array(
+        data=[1.0, 2.0],
+        name="max_active_power",
+        initial_timestamp=datetime(2024, 1, 1),
+        resolution=timedelta(hours=1),
+    )
+    sys.add_time_series(ts, original)
 
-    split = _create_split_generator(sys, original, "gen_01", 50.0)
+    splits = [_build_split_generator(original, f"gen_{i:02}", 50.0) for i in (1, 2)]
+    sys.add_components(*splits)
+    _copy_component_data(sys, original, *splits)
 
-    components = list(sys.get_components(ReEDSGenerator))
-    assert split in components
-    assert split.name in {c.name for c in components}
+    for split in splits:
+        assert len(sys.get_supplemental_attributes_with_component(split)) == 1
+        assert sys.get_time_series(split).data.tolist() == [1.0, 2.0]
 
 
 def test_break_system_generators_no_matching_components(system_with_region) -> None:
@@ -430,8 +442,8 @@ def test_break_system_generators_no_matching_components(system_with_region) -> N
 
     _break_system_generators(sys, reference, capacity_threshold=5, skip_categories=None)
 
-    generators = list(sys.get_components(ReEDSGenerator))
-    assert generators == [generator]
+    generators = tuple(sys.get_components(ReEDSGenerator))
+    assert generators == (generator,)
 
 
 def test_break_system_generators_empty_skip_categories(system_with_region) -> None:
@@ -451,7 +463,7 @@ def test_break_system_generators_empty_skip_categories(system_with_region) -> No
 
     _break_system_generators(sys, reference, capacity_threshold=5, skip_categories=[])
 
-    generators = list(sys.get_components(ReEDSGenerator))
+    generators = tuple(sys.get_components(ReEDSGenerator))
     assert len(generators) == 3
     assert {gen.name for gen in generators} == {"gen_01", "gen_02", "gen_03"}
 
@@ -471,8 +483,8 @@ def test_break_generators_capacity_exactly_matches_reference(system_with_region)
 
     _run_break(sys, reference_units=reference)
 
-    generators = list(sys.get_components(ReEDSGenerator))
-    assert generators == [generator]
+    generators = tuple(sys.get_components(ReEDSGenerator))
+    assert generators == (generator,)
 
 
 def test_break_generators_with_remainder_above_threshold(system_with_region) -> None:
@@ -490,7 +502,7 @@ def test_break_generators_with_remainder_above_threshold(system_with_region) ->
 
     _run_break(sys, reference_units=reference, drop_capacity_threshold=5)
 
-    generators = list(sys.get_components(ReEDSGenerator))
+    generators = tuple(sys.get_components(ReEDSGenerator))
     # 156 / 50 = 3 splits with 6 MW remainder, remainder > 5 so it's included
     assert {gen.name for gen in generators} == {"gen_01", "gen_02", "gen_03", "gen_04"}
     assert sorted(gen.capacity for gen in generators) == [6.0, 50.0, 50.0, 50.0]
@@ -520,7 +532,7 @@ def test_break_generators_multiple_generators_in_system(system_with_region) -> N
 
     _run_break(sys, reference_units=reference)
 
-    generators = list(sys.get_components(ReEDSGenerator))
+    generators = tuple(sys.get_components(ReEDSGenerator))
     names = {gen.name for gen in generators}
     assert "wind_01" in names
     assert "wind_02" in names
@@ -545,7 +557,7 @@ def test_break_generators_with_custom_break_category(system_with_region) -> None
 
     _run_break(sys, reference_units=reference, break_category="technology")
 
-    generators = list(sys.get_components(ReEDSGenerator))
+    generators = tuple(sys.get_components(ReEDSGenerator))
     assert {gen.name for gen in generators} == {"gen_01", "gen_02", "gen_03"}
 
 
@@ -623,17 +635,17 @@ def test_break_generators_preserves_other_attributes(system_with_region) -> None
 
     _run_break(sys, reference_units=reference)
 
-    generators = list(sys.get_components(ReEDSGenerator))
+    generators = tuple(sys.get_components(ReEDSGenerator))
     for gen in generators:
         attrs = sys.get_supplemental_attributes_with_component(gen)
         assert len(attrs) == 2
 
 
-def test_create_split_generator_with_none_values(system_with_region) -> None:
-    """Test _create_split_generator preserves None values from original."""
-    from r2x_reeds.sysmod.break_gens import _create_split_generator
+def test_build_split_generator_with_none_values(system_with_region) -> None:
+    """Test _build_split_generator preserves None values from original."""
+    from r2x_reeds.sysmod.break_gens import _build_split_generator
 
-    sys, region = system_with_region
+    _, region = system_with_region
     original = ReEDSGenerator(
         name="gen",
         region=region,
@@ -644,7 +656,7 @@ def test_create_split_generator_with_none_values(system_with_region) -> None:
         fuel_type=None,
     )
 
-    split = _create_split_generator(sys, original, "split_01", 50.0)
+    split = _build_split_generator(original, "split_01", 50.0)
 
     assert split.category is None
     assert split.heat_rate is None
@@ -666,7 +678,7 @@ def test_break_generators_very_large_capacity(system_with_region) -> None:
 
     _run_break(sys, reference_units=reference)
 
-    generators = list(sys.get_components(ReEDSGenerator))
+    generators = tuple(sys.get_components(ReEDSGenerator))
     assert len(generators) == 10
     assert all(gen.capacity == 100.0 for gen in generators)
 
@@ -686,7 +698,7 @@ def test_break_generators_fractional_splits(system_with_region) -> None:
 
     _run_break(sys, reference_units=reference, drop_capacity_threshold=5)
 
-    generators = list(sys.get_components(ReEDSGenerator))
+    generators = tuple(sys.get_components(ReEDSGenerator))
     capacities = sorted(gen.capacity for gen in generators)
     assert capacities == [25.5, 50.0, 50.0, 50.0]
 
@@ -744,7 +756,7 @@ def test_break_generators_with_path_string_reference(tmp_path: Path, system_with
 
     _run_break(sys, reference_units=str(ref_file))
 
-    generators = list(sys.get_components(ReEDSGenerator))
+    generators = tuple(sys.get_components(ReEDSGenerator))
     assert {gen.name for gen in generators} == {"gen_01", "gen_02", "gen_03"}
 
 
@@ -780,3 +792,18 @@ def test_normalize_reference_data_dict_with_existing_name(caplog) -> None:
     # The key in the result will be the name field value
     assert "wind_custom" in normalized
     assert normalized["wind_custom"]["name"] == "wind_custom"
+
+
+def test_normalize_reference_data_dict_keeps_first_duplicate(caplog) -> None:
+    """Ensure mapping input is keyed directly and duplicate names keep the first entry."""
+    from r2x_reeds.sysmod.break_gens import _normalize_reference_data
+
+    caplog.set_level("WARNING")
+    data = {"wind": {"capacity_MW": 50}, "wind-alt": {"name": "wind", "capacity_MW": 10}}
+    result = _normalize_reference_data(data, "name", "<source>")
+    assert result.is_ok()
+    reference_units = result.unwrap()
+    assert list(reference_units) == ["wind"]
+    assert reference_units["wind"] == {"name": "wind", "capacity_MW": 50}
+    assert "Duplicate entries found for key 'name'" in caplog.text
+    assert "name" not in data["wind"]
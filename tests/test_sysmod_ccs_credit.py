@@ -105,6 +105,73 @@ def test_ccs_credit_scope_upgrade_path(tmp_path: Path) -> None:
     assert generator.ext["UoS Charge"] == pytest.approx(-48.0)
 
 
+def test_ccs_credit_scope_ignores_techs_outside_system(tmp_path: Path) -> None:
+    """Incentive and upgrade rows for technologies absent from the system do not interfere."""
+    system, region = _build_system()
+    generator = _add_generator(system, region, "Gas_CCS_1", "gas_ccs")
+
+    co2_path = _write_csv(
+        tmp_path / "co2.csv",
+        {
+            "tech": ["coal_ccs", "gas_ccs"],
+            "region": ["west", "west"],
+            "vintage": ["2020", "2020"],
+            "incentive": [85.0, 50.0],
+        },
+    )
+    capture_path = _write_csv(
+        tmp_path / "capture.csv",
+        {"tech": ["gas_ccs"], "region": ["west"], "vintage": ["2020"], "capture_rate": [0.4]},
+    )
+    upgrade_path = _write_csv(
+        tmp_path / "upgrade.csv",
+        {"from": ["coal_pre"], "to": ["coal_ccs"], "region": ["west"], "vintage": ["2020"]},
+    )
+
+    _run_ccs(
+        system,
+        co2_incentive_fpath=co2_path,
+        emission_capture_rate_fpath=capture_path,
+        upgrade_link_fpath=upgrade_path,
+    )
+
+    assert generator.ext["UoS Charge"] == pytest.approx(-20.0)
+
+
+def test_ccs_credit_scope_shared_upgrade_target(tmp_path: Path) -> None:
+    """Several upgrade links into the same CCS tech do not make its incentive ambiguous."""
+    system, region = _build_system()
+    generator = _add_generator(system, region, "Coal_CCS_1", "coal_ccs")
+    _add_generator(system, region, "Coal_Pre_1", "coal_pre")
+
+    co2_path = _write_csv(
+        tmp_path / "co2.csv",
+        {"tech": ["coal_ccs"], "region": ["west"], "vintage": ["2020"], "incentive": [85.0]},
+    )
+    capture_path = _write_csv(
+        tmp_path / "capture.csv",
+        {"tech": ["coal_ccs"], "region": ["west"], "vintage": ["2020"], "capture_rate": [0.9]},
+    )
+    upgrade_path = _write_csv(
+        tmp_path / "upgrade.csv",
+        {
+            "from": ["coal_pre", "coal_old"],
+            "to": ["coal_ccs", "coal_ccs"],
+            "region": ["west", "west"],
+            "vintage": ["2020", "2020"],
+        },
+    )
+
+    _run_ccs(
+        system,
+        co2_incentive_fpath=co2_path,
+        emission_capture_rate_fpath=capture_path,
+        upgrade_link_fpath=upgrade_path,
+    )
+
+    assert generator.ext["UoS Charge"] == pytest.approx(-76.5)
+
+
 def test_ccs_credit_scope_missing_production_rate(tmp_path: Path, caplog) -> None:
     """Generators with no capture rate entry are skipped."""
     system, region = _build_system()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import polars as pl
 import pytest
 from infrasys import System
@@ -90,10 +91,42 @@ def test_electrolyzer_scope_full_flow(tmp_path: Path) -> None:
     assert demand.max_active_power == pytest.approx(5.0)
     assert demand.ext["load_type"] == "electrolyzer"
     assert system.has_time_series(demand) is True
+    assert system.get_time_series(demand).data.tolist() == pytest.approx([5.0, 3.0, 0.0])
     assert system.has_time_series(west_gen) is True
     assert system.has_time_series(east_gen) is False
 
 
+def test_electrolyzer_load_series_do_not_share_memory(monkeypatch) -> None:
+    """Each region's load time series owns its data rather than viewing a shared matrix."""
+    system, _, _ = _build_regions()
+    load = pl.DataFrame(
+        {"region": ["west", "west", "east", "east"], "hour": [1, 2, 1, 2], "load_MW": [5.0, 3.0, 4.0, 2.0]}
+    )
+    hour_map = pl.DataFrame(
+        {
+            "hour": [1, 2],
+            "time_index": ["2024-01-01T00:00:00", "2024-01-01T01:00:00"],
+            "season": ["winter", "winter"],
+        }
+    )
+    series_data: list[np.ndarray] = []
+    original_from_array = electrolyzer.SingleTimeSeries.from_array
+
+    def _tracking_from_array(*args, **kwargs):
+        series_data.append(kwargs["data"])
+        return original_from_array(*args, **kwargs)
+
+    monkeypatch.setattr(electrolyzer.SingleTimeSeries, "from_array", _tracking_from_array)
+
+    electrolyzer._add_electrolyzer_load(system, load, hour_map, weather_year=2024)
+
+    assert len(series_data) == 2
+    assert all(data.base is None for data in series_data)
+    assert not np.shares_memory(series_data[0], series_data[1])
+    east_demand = system.get_component(ReEDSDemand, "east_electrolyzer")
+    assert system.get_time_series(east_demand).data.tolist() == pytest.approx([4.0, 2.0])
+
+
 def test_electrolyzer_scope_weather_missing(tmp_path: Path, caplog) -> None:
     """Weather year is required; without it nothing is loaded."""
     system, _, _ = _build_regions()
@@ -154,6 +187,22 @@ def test_electrolyzer_scope_empty_price(caplog) -> None:
     assert "Hydrogen fuel price data is empty" in caplog.text
 
 
+def test_electrolyzer_price_follows_calendar_months() -> None:
+    """Monthly hydrogen prices map onto the hours of their calendar month in $/MWh."""
+    system, west, _ = _build_regions()
+    generator = _add_generator(system, west, "Hydrogen_GEN")
+
+    prices = pl.DataFrame({"region": ["west", "west"], "month": ["m1", "m2"], "h2_price": [2.0, 3.0]})
+    electrolyzer._add_hydrogen_fuel_price(system, prices, weather_year=2023)
+
+    data = system.get_time_series(generator).data
+    assert len(data) == 8736
+    assert data[0] == pytest.approx(60.0)
+    assert data[31 * 24 - 1] == pytest.approx(60.0)
+    assert data[31 * 24] == pytest.approx(90.0)
+    assert data[59 * 24] == pytest.approx(0.0)
+
+
 def test_electrolyzer_region_not_found(tmp_path: Path, caplog) -> None:
     """Test warning when load references non-existent region."""
     system, _, _ = _build_regions()  # Creates "west" and "east" regions
@@ -114,6 +114,35 @@ def test_emission_cap_scope_missing_emissions(caplog) -> None:
     assert not hasattr(system, "_emission_constraints")
 
 
+def test_emission_cap_skips_rates_when_precombustion_disabled(tmp_path: Path, monkeypatch) -> None:
+    """Emission rates are not read when the switches leave precombustion off."""
+    system, region = _build_system()
+    generator = _add_generator(system, region, "coal_2010_west")
+    _attach_emission(system, generator)
+
+    switches_path = _write_csv(
+        tmp_path / "switches.csv", {"switch_name": ["gsw_precombustion"], "value": ["False"]}
+    )
+    loaded: list[str] = []
+    original_load_file = emission_cap.DataStore.load_file
+
+    def _tracking_load_file(*args, **kwargs):
+        loaded.append(kwargs["name"])
+        return original_load_file(*args, **kwargs)
+
+    monkeypatch.setattr(emission_cap.DataStore, "load_file", staticmethod(_tracking_load_file))
+
+    _run_emission_cap(
+        system,
+        emission_cap=100.0,
+        switches_fpath=switches_path,
+        emission_rates_fpath=str(tmp_path / "missing_rates.csv"),
+    )
+
+    assert loaded == ["switches"]
+    assert system.get_supplemental_attributes_with_component(generator, ReEDSEmission)[0].rate == 1.0
+
+
 @pytest.mark.parametrize(
     "switch_input",
     [
@@ -139,7 +168,8 @@ def test_precombustion_scope(switch_input) -> None:
         }
     )
 
-    emission_cap._add_precombustion_if_enabled(system, switch_input, emit_rates)
+    assert emission_cap._precombustion_enabled(switch_input) is True
+    emission_cap._add_precombustion_rates(system, emit_rates)
 
     emission_attr = system.get_supplemental_attributes_with_component(generator, ReEDSEmission)[0]
     assert emission_attr.rate == pytest.approx(1.5)
@@ -181,6 +211,25 @@ def test_precombustion_scope_duplicate_attributes() -> None:
         emission_cap.add_precombustion(system, emission_rates)
 
 
+def test_precombustion_duplicate_untargeted_type_still_applies_rate() -> None:
+    """Duplicate or missing attributes of types no rate row can apply do not block other types."""
+    system, region = _build_system()
+    generator = _add_generator(system, region, "GEN_MIXED")
+    _attach_emission(system, generator, rate=1.0)
+    system.add_supplemental_attribute(generator, ReEDSEmission(rate=0.2, type=EmissionType.CH4))
+    system.add_supplemental_attribute(generator, ReEDSEmission(rate=0.4, type=EmissionType.CH4))
+
+    emission_rates = pl.DataFrame(
+        {"generator_name": ["GEN_MIXED", "GEN_MIXED"], "emission_type": ["SO2", "CO2"], "rate": [0.5, 3.0]}
+    )
+
+    assert emission_cap.add_precombustion(system, emission_rates) is True
+
+    emissions = system.get_supplemental_attributes_with_component(generator, ReEDSEmission)
+    co2 = [emission for emission in emissions if emission.type == EmissionType.CO2]
+    assert co2[0].rate == pytest.approx(4.0)
+
+
 def test_emission_constraint_scope(caplog) -> None:
     """set_emission_constraint returns early when no cap is provided."""
     system, _ = _build_system()
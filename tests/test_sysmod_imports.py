@@ -76,6 +76,76 @@ def test_imports_scope_full_flow(tmp_path: Path) -> None:
     assert all(val > 0 for val in ts_values)
 
 
+def test_imports_scope_daily_budget_in_date_order(tmp_path: Path) -> None:
+    """Daily budgets follow the calendar order of the hour map."""
+    system, generator = _build_generator()
+
+    hour_map_path = _write_csv(
+        tmp_path / "hour_map.csv",
+        {
+            "hour": [1, 2, 3, 4],
+            "time_index": [
+                "2024-01-03T00:00:00",
+                "2024-01-01T00:00:00",
+                "2024-01-01T01:00:00",
+                "2024-01-02T00:00:00",
+            ],
+            "season": ["winter", "spring", "spring", "winter"],
+        },
+    )
+    szn_frac_path = _write_csv(
+        tmp_path / "szn_frac.csv", {"season": ["winter", "spring"], "value": [0.3, 0.4]}
+    )
+    imports_path = _write_csv(tmp_path / "imports.csv", {"r": ["west"], "value": [1000.0]})
+
+    _run_imports(
+        system,
+        weather_year=2024,
+        canada_imports_fpath=imports_path,
+        canada_szn_frac_fpath=szn_frac_path,
+        hour_map_fpath=hour_map_path,
+    )
+
+    assert system.get_time_series(generator).data.tolist() == pytest.approx([0.4, 0.3])
+
+
+def test_imports_scope_generators_share_region_budget(tmp_path: Path) -> None:
+    """Import generators in the same region receive the same hydro budget."""
+    system, generator = _build_generator()
+    other = ReEDSGenerator(
+        name="can-imports_west_2",
+        region=generator.region,
+        capacity=25.0,
+        technology="canada_import",
+        category="imports",
+    )
+    system.add_component(other)
+
+    hour_map_path = _write_csv(
+        tmp_path / "hour_map.csv",
+        {
+            "hour": [1, 2, 3],
+            "time_index": ["2024-01-01T00:00:00", "2024-01-02T00:00:00", "2024-01-03T00:00:00"],
+            "season": ["winter", "winter", "winter"],
+        },
+    )
+    szn_frac_path = _write_csv(tmp_path / "szn_frac.csv", {"season": ["winter"], "value": [1.0]})
+    imports_path = _write_csv(tmp_path / "imports.csv", {"r": ["west"], "value": [3000.0]})
+
+    _run_imports(
+        system,
+        weather_year=2024,
+        canada_imports_fpath=imports_path,
+        canada_szn_frac_fpath=szn_frac_path,
+        hour_map_fpath=hour_map_path,
+    )
+
+    for component in (generator, other):
+        assert system.get_time_series(component, name="hydro_budget").data.tolist() == pytest.approx(
+            [1.0, 1.0]
+        )
+
+
 def test_imports_scope_missing_weather_year(caplog) -> None:
     """Weather year is required to build imports time series."""
     system, _ = _build_generator()
@@ -169,3 +239,23 @@ def test_imports_scope_exception_logs(tmp_path: Path, caplog) -> None:
 
     assert result.is_err()
     assert "error in imports plugin" in caplog.text.lower()
+
+
+@pytest.mark.parametrize(
+    "time_index",
+    [
+        ["2024-01-01T05:00:00", "2024-01-02T00:00:00"],
+        pl.Series(["2024-01-01T05:00:00", "2024-01-02T00:00:00"]).str.to_datetime(),
+        pl.Series(["2024-01-01", "2024-01-02"]).str.to_date(),
+    ],
+    ids=["string", "datetime", "date"],
+)
+def test_imports_time_index_date_accepts_typed_columns(time_index) -> None:
+    """Typed time indices are used as-is and only string timestamps are parsed."""
+    from datetime import date
+
+    hour_map = pl.LazyFrame({"time_index": time_index})
+
+    result = hour_map.select(imports._time_index_date(hour_map)).collect()
+
+    assert result["time_index"].to_list() == [date(2024, 1, 1), date(2024, 1, 2)]
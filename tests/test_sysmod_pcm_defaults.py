@@ -55,7 +55,7 @@ def test_pcm_defaults_scope_override() -> None:
 
 
 def test_pcm_defaults_scope_file(tmp_path: Path) -> None:
-    """Defaults can be loaded from JSON files via DataStore."""
+    """Defaults can be loaded from JSON files."""
     system, generator = _build_generator()
     defaults = {"GEN1": {"fuel_price": 4.5}}
     json_path = tmp_path / "pcm_defaults.json"
@@ -97,3 +97,23 @@ def test_pcm_defaults_scope_multiplication_runs() -> None:
 
     _run_pcm_defaults(system, pcm_defaults_dict=defaults)
     assert generator.ext == {}
+
+
+def test_pcm_defaults_scope_shared_entry() -> None:
+    """Generators matched to the same entry each receive its non-null defaults."""
+    system, first = _build_generator(name="GEN1")
+    second = ReEDSGenerator(
+        name="GEN2", region=first.region, capacity=50.0, technology="coal", category="coal"
+    )
+    system.add_component(second)
+
+    _run_pcm_defaults(
+        system,
+        pcm_defaults_dict={"coal": {"capacity": 80.0, "heat_rate": 9.5, "fuel_price": None}},
+        pcm_defaults_override=True,
+    )
+
+    for generator in (first, second):
+        assert generator.capacity == 80.0
+        assert generator.heat_rate == 9.5
+        assert generator.fuel_price is None
@@ -212,3 +212,47 @@ def test_coerce_path_pathlike_object_returns_ok(tmp_path: Path) -> None:
 
     assert result.is_ok()
     assert result.unwrap() == test_file
+
+
+@pytest.mark.unit
+def test_read_json_cached_reuses_parsed_content(tmp_path: Path) -> None:
+    """Test cached JSON reads return the same object until the file changes."""
+    import os
+
+    from r2x_reeds.sysmod.utils import _read_json_cached
+
+    json_file = tmp_path / "reference.json"
+    json_file.write_text('{"wind": {"capacity_MW": 100}}')
+
+    first = _read_json_cached(json_file)
+    second = _read_json_cached(json_file)
+    assert first is second
+    assert first == {"wind": {"capacity_MW": 100}}
+
+    json_file.write_text('{"solar": {"capacity_MW": 50}}')
+    stat_result = json_file.stat()
+    os.utime(json_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+    updated = _read_json_cached(json_file)
+    assert updated == {"solar": {"capacity_MW": 50}}
+
+
+@pytest.mark.unit
+def test_gc_paused_restores_previous_state() -> None:
+    """Test garbage collection is suspended in the block and restored afterwards."""
+    import gc
+
+    from r2x_reeds.sysmod.utils import _gc_paused
+
+    assert gc.isenabled()
+    with _gc_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        with _gc_paused():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
@@ -61,6 +61,27 @@ def test_version_detector_tag_column_any_position(tmp_path: Path) -> None:
     assert detector.read_version(tmp_path) == "2025.12.01"
 
 
+def test_version_detector_quoted_fields(tmp_path: Path) -> None:
+    """Quoted fields containing commas do not shift the tag column."""
+    meta_path = tmp_path / "meta.csv"
+    with open(meta_path, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["computer", "repo", "branch", "commit", "description", "tag"])
+        writer.writerow(["host", "/path", "main", "abc123", "run, with comma", "2026.01.22"])
+
+    detector = ReEDSVersionDetector()
+    assert detector.read_version(tmp_path) == "2026.01.22"
+
+
+def test_version_detector_header_only_returns_sentinel(tmp_path: Path) -> None:
+    """A meta file without a data row returns LEGACY_VERSION."""
+    meta_path = tmp_path / "meta.csv"
+    meta_path.write_text("computer,repo,branch,commit,description,tag\n")
+
+    detector = ReEDSVersionDetector()
+    assert detector.read_version(tmp_path) == LEGACY_VERSION
+
+
 def test_version_detector_missing_file(tmp_path: Path) -> None:
     """Missing files raise FileNotFoundError."""
     detector = ReEDSVersionDetector()